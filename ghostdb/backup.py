@@ -0,0 +1,302 @@
+###############################################################################
+# Copyright (C) 2026, created on October 18, 2026
+# Written by Justin Ho
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This source code is distributed in the hope that it will be useful and
+# without warranty or implied warranty of merchantability or fitness for a
+# particular purpose.
+###############################################################################
+
+import base64
+import datetime
+import gzip
+import json
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import Date, DateTime, LargeBinary, text
+from sqlalchemy.sql import select
+
+from . import schema
+from .utils import batched
+
+manifest_name = "manifest.json"
+
+
+def encode_value(value):
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode()
+    raise TypeError("can't export %r" % type(value))
+
+
+def decoders(table):
+    """Returns column name -> function turning an exported value back into a python value"""
+    result = {}
+    for column in table.columns:
+        if isinstance(column.type, DateTime):
+            result[column.name] = datetime.datetime.fromisoformat
+        elif isinstance(column.type, Date):
+            result[column.name] = datetime.date.fromisoformat
+        elif isinstance(column.type, LargeBinary):
+            result[column.name] = base64.b64decode
+    return result
+
+
+def write_json(path, data):
+    """Writes data to path atomically, a crash leaves the old or the new file"""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=1, default=encode_value)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def read_json(path, default=None):
+    if not os.path.exists(path):
+        return default
+    with open(path) as f:
+        return json.load(f)
+
+
+def select_tables(names=None):
+    """Returns the tables of the schema in foreign key order, optionally only the named ones"""
+    tables = schema.metadata.sorted_tables
+    if names:
+        unknown = set(names) - {table.name for table in tables}
+        if unknown:
+            raise KeyError("unknown tables: %s" % ", ".join(sorted(unknown)))
+        tables = [table for table in tables if table.name in names]
+    return tables
+
+
+def shard_bounds(connection, table, shard_rows):
+    """Splits a table into primary key ranges of about shard_rows rows
+
+    Every boundary is found with one query walking the primary key index,
+    tables without a single column primary key are one shard.
+
+    Returns
+    -------
+    list
+        (lower, upper) tuples, lower is exclusive and upper inclusive, None is unbounded
+    """
+    keys = list(table.primary_key.columns)
+    if len(keys) != 1:
+        return [(None, None)]
+    key = keys[0]
+    bounds = []
+    lower = None
+    while True:
+        query = select(key).order_by(key).offset(shard_rows - 1).limit(1)
+        if lower is not None:
+            query = query.filter(key > lower)
+        upper = connection.execute(query).scalar()
+        if upper is None:
+            bounds.append((lower, None))
+            return bounds
+        bounds.append((lower, upper))
+        lower = upper
+
+
+def shard_query(table, lower, upper):
+    query = select(table)
+    keys = list(table.primary_key.columns)
+    if len(keys) == 1:
+        key = keys[0]
+        if lower is not None:
+            query = query.filter(key > lower)
+        if upper is not None:
+            query = query.filter(key <= upper)
+    return query.order_by(*keys)
+
+
+class Backup:
+    """Parallel, resumable export and restore of the ghost tables
+
+    export() splits every table into primary key ranges of shard_rows rows
+    and streams the ranges concurrently, each over its own connection with a
+    server side cursor, into gzip compressed json lines files. manifest.json
+    lists the shards and which of them are complete; a shard file is only
+    written under its final name once all its rows are in, so running
+    export() again after an interruption only exports the missing shards.
+
+    restore() loads the shards concurrently, one transaction per shard, and
+    records the finished ones in restored.json so it resumes the same way.
+    Foreign key checks are switched off for the restore connections on
+    mysql, the tables are expected to exist and to be empty.
+
+    The shards are consistent per shard, not across the database, export
+    from a replica or a quiet blog for a consistent snapshot.
+
+    Parameters
+    ----------
+    engine : Engine
+        database engine, its pool should allow workers connections
+    directory : str
+        directory of the manifest and shard files
+    workers : int, optional
+        shards exported or restored at the same time, by default 4
+    shard_rows : int, optional
+        rows per shard, by default 100000
+    batch_size : int, optional
+        rows fetched or inserted at a time, by default 1000
+    """
+
+    def __init__(self, engine, directory, workers=4, shard_rows=100000, batch_size=1000):
+        self.engine = engine
+        self.directory = directory
+        self.workers = workers
+        self.shard_rows = shard_rows
+        self.batch_size = batch_size
+        self.manifest_path = os.path.join(directory, manifest_name)
+        self._lock = threading.Lock()
+
+    def _save(self, path, data):
+        with self._lock:
+            write_json(path, data)
+
+    def plan(self, tables):
+        """Loads the manifest and adds shards for the tables it doesn't have yet"""
+        os.makedirs(self.directory, exist_ok=True)
+        manifest = read_json(self.manifest_path, {"version": 1, "tables": {}})
+        missing = [table for table in tables if table.name not in manifest["tables"]]
+
+        def plan_table(table):
+            with self.engine.connect() as connection:
+                bounds = shard_bounds(connection, table, self.shard_rows)
+            return table.name, {
+                "columns": [column.name for column in table.columns],
+                "shards": [{"file": "%s.%05d.jsonl.gz" % (table.name, i), "lower": lower, "upper": upper,
+                            "rows": None, "done": False} for i, (lower, upper) in enumerate(bounds)],
+            }
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for name, entry in executor.map(plan_table, missing):
+                manifest["tables"][name] = entry
+        self._save(self.manifest_path, manifest)
+        return manifest
+
+    def export(self, tables=None):
+        """Exports the tables, skipping shards a previous run completed
+
+        Parameters
+        ----------
+        tables : list, optional
+            table names, by default every table of the schema
+
+        Returns
+        -------
+        dict
+            table name -> rows exported by this run
+        """
+        tables = select_tables(tables)
+        manifest = self.plan(tables)
+        jobs = [(table, shard) for table in tables for shard in manifest["tables"][table.name]["shards"]
+                if not shard["done"]]
+
+        def export_shard(job):
+            table, shard = job
+            rows = self.export_shard(table, shard)
+            with self._lock:
+                shard["rows"], shard["done"] = rows, True
+                write_json(self.manifest_path, manifest)
+            return table.name, rows
+
+        exported = {table.name: 0 for table in tables}
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for name, rows in executor.map(export_shard, jobs):
+                exported[name] += rows
+        return exported
+
+    def export_shard(self, table, shard):
+        path = os.path.join(self.directory, shard["file"])
+        tmp = path + ".part"
+        rows = 0
+        with self.engine.connect() as connection:
+            result = connection.execution_options(stream_results=True).execute(
+                shard_query(table, shard["lower"], shard["upper"]))
+            with gzip.open(tmp, "wt", encoding="utf-8") as f:
+                for partition in result.mappings().partitions(self.batch_size):
+                    for row in partition:
+                        f.write(json.dumps(dict(row), default=encode_value, separators=(",", ":")))
+                        f.write("\n")
+                    rows += len(partition)
+        os.replace(tmp, path)
+        return rows
+
+    def restore(self, tables=None):
+        """Restores the exported tables, skipping shards a previous run restored
+
+        Parameters
+        ----------
+        tables : list, optional
+            table names, by default every table in the manifest
+
+        Returns
+        -------
+        dict
+            table name -> rows restored by this run
+        """
+        manifest = read_json(self.manifest_path)
+        if manifest is None:
+            raise FileNotFoundError(self.manifest_path)
+        tables = [table for table in select_tables(tables) if table.name in manifest["tables"]]
+        restored_path = os.path.join(self.directory, "restored.json")
+        restored = read_json(restored_path, {"shards": []})
+        done = set(restored["shards"])
+        for table in tables:
+            shards = manifest["tables"][table.name]["shards"]
+            incomplete = [shard["file"] for shard in shards if not shard["done"]]
+            if incomplete:
+                raise ValueError("export of %s is incomplete, missing %s"
+                                 % (table.name, ", ".join(incomplete)))
+        jobs = [(table, shard) for table in tables for shard in manifest["tables"][table.name]["shards"]
+                if shard["file"] not in done]
+
+        def restore_shard(job):
+            table, shard = job
+            rows = self.restore_shard(table, shard)
+            with self._lock:
+                restored["shards"].append(shard["file"])
+                write_json(restored_path, restored)
+            return table.name, rows
+
+        counts = {table.name: 0 for table in tables}
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for name, rows in executor.map(restore_shard, jobs):
+                counts[name] += rows
+        return counts
+
+    def restore_shard(self, table, shard):
+        convert = decoders(table)
+        rows = 0
+        with gzip.open(os.path.join(self.directory, shard["file"]), "rt", encoding="utf-8") as f:
+            lines = (json.loads(line) for line in f)
+            with self.engine.begin() as connection:
+                if connection.dialect.name == "mysql":
+                    connection.execute(text("SET FOREIGN_KEY_CHECKS = 0"))
+                try:
+                    for batch in batched(lines, self.batch_size):
+                        for row in batch:
+                            for name, decode in convert.items():
+                                if row.get(name) is not None:
+                                    row[name] = decode(row[name])
+                        connection.execute(table.insert(), batch)
+                        rows += len(batch)
+                finally:
+                    if connection.dialect.name == "mysql":
+                        connection.execute(text("SET FOREIGN_KEY_CHECKS = 1"))
+        return rows
@@ -0,0 +1,190 @@
+###############################################################################
+# Copyright (C) 2026, created on October 18, 2026
+# Written by Justin Ho
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This source code is distributed in the hope that it will be useful and
+# without warranty or implied warranty of merchantability or fitness for a
+# particular purpose.
+###############################################################################
+
+import asyncio
+import datetime
+import json
+import os
+import tempfile
+import time
+
+from sqlalchemy import and_, or_
+from sqlalchemy.sql import select
+
+from .schema import Action
+from .utils import decode_cursor, encode_cursor
+
+columns = (Action.id, Action.resource_id, Action.resource_type, Action.actor_id, Action.actor_type,
+           Action.event, Action.context, Action.created_at)
+
+
+class ActionEvent:
+    """One row of actions, context is parsed from json on first access"""
+
+    __slots__ = ("id", "resource_id", "resource_type", "actor_id", "actor_type", "event", "created_at",
+                 "raw_context", "_context")
+
+    def __init__(self, row):
+        self.id = row.id
+        self.resource_id = row.resource_id
+        self.resource_type = row.resource_type
+        self.actor_id = row.actor_id
+        self.actor_type = row.actor_type
+        self.event = row.event
+        self.created_at = row.created_at
+        self.raw_context = row.context
+        self._context = None
+
+    @property
+    def context(self):
+        if self._context is None and self.raw_context:
+            self._context = json.loads(self.raw_context)
+        return self._context
+
+    @property
+    def cursor(self):
+        return self.created_at, self.id
+
+    def __repr__(self):
+        return "<ActionEvent %s %s %s %s>" % (self.created_at, self.resource_type, self.event, self.id)
+
+
+class FileCursorStore:
+    """Keeps a change feed cursor in a file, replaced atomically on save"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self):
+        try:
+            with open(self.path) as f:
+                value = f.read().strip()
+        except FileNotFoundError:
+            return None
+        return decode_cursor(value) if value else None
+
+    def save(self, cursor):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".cursor-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(encode_cursor(cursor))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
+class ChangeFeed:
+    """Tails the actions table by a (created_at, id) cursor
+
+    Each batch is one keyset query on (created_at, id), so reading the feed
+    costs the same however long the history is. The cursor is saved to the
+    store after a batch has been consumed, a consumer that stops in the
+    middle of a batch sees that batch again when it resumes, delivery is at
+    least once.
+
+    actions rows are written with second resolution and may commit out of
+    order, a row committed after the feed passed its created_at is missed.
+    delay keeps the feed that many seconds behind the clock to leave room
+    for slow transactions.
+
+    Parameters
+    ----------
+    store : FileCursorStore, optional
+        loads and saves the cursor, by default the cursor is kept in memory only
+    batch_size : int, optional
+        rows read per query, by default 500
+    resource_types : iterable, optional
+        only actions on these resource types
+    events : iterable, optional
+        only these events, for example added or edited
+    delay : float, optional
+        seconds the feed stays behind now (utc), by default 0
+    """
+
+    def __init__(self, store=None, batch_size=500, resource_types=None, events=None, delay=0.0):
+        self.store = store
+        self.batch_size = batch_size
+        self.resource_types = list(resource_types) if resource_types else None
+        self.events = list(events) if events else None
+        self.delay = delay
+        self.cursor = store.load() if store is not None else None
+
+    def query(self):
+        query = select(*columns)
+        if self.cursor is not None:
+            created_at, action_id = self.cursor
+            query = query.filter(or_(Action.created_at > created_at,
+                                     and_(Action.created_at == created_at, Action.id > action_id)))
+        if self.resource_types:
+            query = query.filter(Action.resource_type.in_(self.resource_types))
+        if self.events:
+            query = query.filter(Action.event.in_(self.events))
+        if self.delay:
+            until = datetime.datetime.utcnow() - datetime.timedelta(seconds=self.delay)
+            query = query.filter(Action.created_at <= until)
+        return query.order_by(Action.created_at, Action.id).limit(self.batch_size)
+
+    def advance(self, batch):
+        """Moves the cursor past batch and saves it"""
+        if batch:
+            self.cursor = batch[-1].cursor
+            if self.store is not None:
+                self.store.save(self.cursor)
+
+    def poll(self, session):
+        """Returns the next batch of actions without moving the cursor"""
+        return [ActionEvent(row) for row in session.execute(self.query())]
+
+    async def poll_async(self, session):
+        """Returns the next batch of actions through an asyncio session"""
+        return [ActionEvent(row) for row in await session.execute(self.query())]
+
+    def iter(self, session, follow=False, poll_interval=1.0):
+        """Yields actions after the cursor
+
+        Parameters
+        ----------
+        session : session
+            database session
+        follow : bool, optional
+            keep waiting for new actions instead of stopping at the end, by default False
+        poll_interval : float, optional
+            seconds between queries once the feed caught up, by default 1
+        """
+        while True:
+            batch = self.poll(session)
+            yield from batch
+            self.advance(batch)
+            if len(batch) < self.batch_size:
+                if not follow:
+                    return
+                # let the next query see rows committed since this transaction started
+                session.rollback()
+                time.sleep(poll_interval)
+
+    async def aiter(self, session, follow=False, poll_interval=1.0):
+        """Async version of iter for an asyncio session, see get_async_session"""
+        while True:
+            batch = await self.poll_async(session)
+            for event in batch:
+                yield event
+            self.advance(batch)
+            if len(batch) < self.batch_size:
+                if not follow:
+                    return
+                await session.rollback()
+                await asyncio.sleep(poll_interval)
@@ -0,0 +1,221 @@
+###############################################################################
+# Copyright (C) 2026, created on October 18, 2026
+# Written by Justin Ho
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This source code is distributed in the hope that it will be useful and
+# without warranty or implied warranty of merchantability or fitness for a
+# particular purpose.
+###############################################################################
+
+import collections
+import datetime
+import logging
+import threading
+import time
+
+from sqlalchemy import case, update
+from sqlalchemy.sql import select
+
+from .schema import ApiKey, Session, Token
+from .utils import batched
+
+logger = logging.getLogger(__name__)
+
+# kind -> (lookup column, columns returned)
+kinds = {
+    "session": (Session.session_id, (Session.id, Session.session_id, Session.user_id, Session.session_data,
+                                     Session.created_at, Session.updated_at)),
+    "token": (Token.token, (Token.id, Token.token, Token.data, Token.created_at, Token.created_by)),
+    "api_key": (ApiKey.secret, (ApiKey.id, ApiKey.type, ApiKey.secret, ApiKey.role_id, ApiKey.integration_id,
+                                ApiKey.user_id, ApiKey.last_seen_at, ApiKey.last_seen_version)),
+}
+
+
+class CredentialCache:
+    """Short lived cache of sessions, tokens and api keys
+
+    Found credentials are cached for ttl seconds and unknown keys for
+    negative_ttl seconds, so repeated requests with the same cookie or key
+    do not reach the database and guessing keys can't flood it either.
+    Misses of lookup_many are resolved with one query per kind.
+
+    api_keys.last_seen_at is updated write-behind, lookups only record the
+    time in memory and flush() writes all of them with a single UPDATE. Call
+    start() to flush every flush_interval seconds from a background thread
+    and close() to write the last ones on shutdown. Revoked credentials stay
+    valid until their entry expires unless invalidate() is called.
+
+    Parameters
+    ----------
+    session_factory : callable
+        returns a new database session, for example a sessionmaker
+    ttl : float, optional
+        seconds a found credential is cached, by default 30
+    negative_ttl : float, optional
+        seconds an unknown key is cached, by default 5
+    max_entries : int, optional
+        entries kept per kind, least recently used first out, by default 100000
+    flush_interval : float, optional
+        seconds between writes of last_seen_at by the background thread, by default 10
+    """
+
+    def __init__(self, session_factory, ttl=30.0, negative_ttl=5.0, max_entries=100000, flush_interval=10.0):
+        self.session_factory = session_factory
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.flush_interval = flush_interval
+        self.entries = {kind: collections.OrderedDict() for kind in kinds}
+        self.seen = {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def lookup(self, kind, key):
+        """Returns the row of a credential as a dictionary, None when unknown"""
+        return self.lookup_many(kind, [key]).get(key)
+
+    def lookup_session(self, session_id):
+        return self.lookup("session", session_id)
+
+    def lookup_token(self, token):
+        return self.lookup("token", token)
+
+    def lookup_api_key(self, secret, version=None):
+        """Returns an api key and records it as seen now"""
+        api_key = self.lookup("api_key", secret)
+        if api_key is not None:
+            self.touch_api_key(api_key["id"], version=version)
+        return api_key
+
+    def lookup_many(self, kind, keys):
+        """Resolves many keys of one kind, querying the misses together
+
+        Parameters
+        ----------
+        kind : str
+            session, token or api_key
+        keys : iterable
+            session ids, tokens or api key secrets
+
+        Returns
+        -------
+        dict
+            key -> row dictionary, unknown keys are left out
+        """
+        now = time.monotonic()
+        found = {}
+        missing = set()
+        entries = self.entries[kind]
+        with self._lock:
+            for key in keys:
+                entry = entries.get(key)
+                if entry is not None and entry[0] > now:
+                    entries.move_to_end(key)
+                    self.hits += 1
+                    if entry[1] is not None:
+                        found[key] = entry[1]
+                else:
+                    missing.add(key)
+            self.misses += len(missing)
+        if not missing:
+            return found
+
+        column, columns = kinds[kind]
+        session = self.session_factory()
+        try:
+            rows = {}
+            for chunk in batched(sorted(missing), 500):
+                for row in session.execute(select(*columns).filter(column.in_(chunk))).mappings():
+                    rows.setdefault(row[column.key], dict(row))
+        finally:
+            session.close()
+
+        with self._lock:
+            for key in missing:
+                row = rows.get(key)
+                entries[key] = (now + (self.ttl if row is not None else self.negative_ttl), row)
+                entries.move_to_end(key)
+                if row is not None:
+                    found[key] = row
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+        return found
+
+    def invalidate(self, kind, key):
+        """Drops a credential from the cache, for example after revoking it"""
+        with self._lock:
+            self.entries[kind].pop(key, None)
+
+    def touch_api_key(self, api_key_id, when=None, version=None):
+        """Records an api key as seen, written on the next flush"""
+        when = when or datetime.datetime.utcnow().replace(microsecond=0)
+        with self._lock:
+            previous = self.seen.get(api_key_id)
+            if previous is None or previous[0] <= when:
+                self.seen[api_key_id] = (when, version or (previous[1] if previous else None))
+
+    def flush(self):
+        """Writes the recorded last_seen_at values with one UPDATE per 500 keys
+
+        Returns
+        -------
+        int
+            number of api keys written
+        """
+        with self._lock:
+            seen, self.seen = self.seen, {}
+        if not seen:
+            return 0
+        session = self.session_factory()
+        try:
+            for chunk in batched(sorted(seen.items()), 500):
+                ids = [api_key_id for api_key_id, _ in chunk]
+                times = {api_key_id: when for api_key_id, (when, _) in chunk}
+                values = {"last_seen_at": case(times, value=ApiKey.id)}
+                versions = {api_key_id: version for api_key_id, (_, version) in chunk if version}
+                if versions:
+                    values["last_seen_version"] = case(versions, value=ApiKey.id,
+                                                       else_=ApiKey.last_seen_version)
+                session.execute(update(ApiKey.__table__).where(ApiKey.id.in_(ids)).values(values))
+            session.commit()
+        except Exception:
+            session.rollback()
+            # keep the values for the next flush, unless newer ones were recorded meanwhile
+            with self._lock:
+                for api_key_id, value in seen.items():
+                    self.seen.setdefault(api_key_id, value)
+            raise
+        finally:
+            session.close()
+        return len(seen)
+
+    def start(self):
+        """Starts flushing last_seen_at from a background thread"""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="ghostdb-credentials", daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self):
+        """Stops the background thread and writes the remaining last_seen_at values"""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                # the values are kept and retried on the next interval
+                logger.exception("flushing api key last_seen_at failed")
@@ -0,0 +1,204 @@
+###############################################################################
+# Copyright (C) 2026, created on October 18, 2026
+# Written by Justin Ho
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This source code is distributed in the hope that it will be useful and
+# without warranty or implied warranty of merchantability or fitness for a
+# particular purpose.
+###############################################################################
+
+import datetime
+import logging
+import queue
+import threading
+import time
+
+from sqlalchemy import insert
+
+from .schema import MembersLoginEvent, MembersStatusEvent, TempMemberAnalyticEvent
+from .utils import object_id
+
+logger = logging.getLogger(__name__)
+
+tables = {
+    "analytic": TempMemberAnalyticEvent.__table__,
+    "login": MembersLoginEvent.__table__,
+    "status": MembersStatusEvent.__table__,
+}
+
+_stop = object()
+
+
+class EventWriter:
+    """Buffers member events and writes them in multi-row inserts
+
+    write() puts a row on a bounded queue and returns, a background thread
+    collects rows until batch_size are waiting or flush_interval seconds
+    passed since the first one and inserts them with one INSERT per table in
+    one transaction. When the queue is full write() blocks for up to timeout
+    seconds and then raises queue.Full, so callers slow down instead of the
+    buffer growing without limit.
+
+    Durability: a row is only stored once its batch commits. Rows still on
+    the queue or in a batch are lost if the process dies, up to max_queue +
+    batch_size rows or about flush_interval seconds of events. close() and
+    drain() wait until everything written before them is committed. A batch
+    that fails is retried retries times with a growing delay, then it is
+    dropped, logged and counted in metrics()["dropped"]. Use these events
+    for analytics only where losing a few of them is acceptable.
+
+    Parameters
+    ----------
+    session_factory : callable
+        returns a new database session, for example a sessionmaker
+    max_queue : int, optional
+        rows buffered before write() blocks, by default 10000
+    batch_size : int, optional
+        rows per transaction, by default 500
+    flush_interval : float, optional
+        seconds a row waits at most before its batch is written, by default 1
+    timeout : float, optional
+        seconds write() waits for room in the queue, None waits forever, by default 1
+    retries : int, optional
+        attempts to write a failing batch again, by default 3
+    """
+
+    def __init__(self, session_factory, max_queue=10000, batch_size=500, flush_interval=1.0, timeout=1.0,
+                 retries=3):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.timeout = timeout
+        self.retries = retries
+        self.queue = queue.Queue(max_queue)
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+        self.closed = False
+        # held around the closed check and the put so no row is queued behind the stop marker
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="ghostdb-events", daemon=True)
+        self._thread.start()
+
+    def write(self, kind, **values):
+        """Queues one event row
+
+        Parameters
+        ----------
+        kind : str
+            analytic, login or status
+        values : dict
+            values by column name (metadata, not the metadata_ attribute), id and
+            created_at are filled in when missing
+
+        Raises
+        ------
+        KeyError
+            for an unknown kind or column, checked here so one bad row can't fail a batch
+        queue.Full
+            when the queue stays full for timeout seconds
+        RuntimeError
+            after close()
+        """
+        if kind not in tables:
+            raise KeyError(kind)
+        unknown = set(values) - set(tables[kind].c.keys())
+        if unknown:
+            raise KeyError("unknown columns of %s: %s" % (tables[kind].name, ", ".join(sorted(unknown))))
+        values.setdefault("id", object_id())
+        values.setdefault("created_at", datetime.datetime.utcnow())
+        with self._lock:
+            if self.closed:
+                raise RuntimeError("event writer is closed")
+            self.queue.put((kind, values), timeout=self.timeout)
+        return values["id"]
+
+    def login(self, member_id, **values):
+        return self.write("login", member_id=member_id, **values)
+
+    def status(self, member_id, from_status, to_status, **values):
+        return self.write("status", member_id=member_id, from_status=from_status, to_status=to_status,
+                          **values)
+
+    def analytic(self, event_name, member_id, member_status, **values):
+        return self.write("analytic", event_name=event_name, member_id=member_id, member_status=member_status,
+                          **values)
+
+    def drain(self):
+        """Waits until every row queued so far is committed or dropped"""
+        self.queue.join()
+
+    def close(self):
+        """Stops accepting rows, writes the queued ones and stops the thread"""
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+            self.queue.put((_stop, None))
+        self._thread.join()
+
+    def metrics(self):
+        return {
+            "pending": self.queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+            "batches": self.batches,
+        }
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch = []
+            kind, values = self.queue.get()
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if kind is _stop:
+                    stopping = True
+                    self.queue.task_done()
+                else:
+                    batch.append((kind, values))
+                if stopping or len(batch) >= self.batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    kind, values = self.queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            if batch:
+                self._write(batch)
+                for _ in batch:
+                    self.queue.task_done()
+
+    def _write(self, batch):
+        rows = {}
+        for kind, values in batch:
+            rows.setdefault(kind, []).append(values)
+        for attempt in range(self.retries + 1):
+            session = self.session_factory()
+            try:
+                for kind, values in rows.items():
+                    # rows of one kind may set different columns, group them by columns
+                    groups = {}
+                    for row in values:
+                        groups.setdefault(tuple(sorted(row)), []).append(row)
+                    for group in groups.values():
+                        session.execute(insert(tables[kind]).values(group))
+                session.commit()
+                self.written += len(batch)
+                self.batches += 1
+                return
+            except Exception:
+                session.rollback()
+                if attempt == self.retries:
+                    self.dropped += len(batch)
+                    logger.exception("dropped %d member events", len(batch))
+                    return
+                time.sleep(min(0.1 * 2 ** attempt, 5.0))
+            finally:
+                session.close()
@@ -0,0 +1,124 @@
+###############################################################################
+# Copyright (C) 2026, created on October 18, 2026
+# Written by Justin Ho
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This source code is distributed in the hope that it will be useful and
+# without warranty or implied warranty of merchantability or fitness for a
+# particular purpose.
+###############################################################################
+
+import datetime
+import time
+
+from sqlalchemy import and_, func, insert, literal, true
+from sqlalchemy.sql import select
+
+from .member_filter import compile_filter
+from .schema import EmailBatch, EmailRecipient, Member
+from .utils import object_id
+
+
+class FanOutResult:
+    """Summary of a fan out run"""
+
+    def __init__(self, email_id):
+        self.email_id = email_id
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+        self.batches = 0
+        self.recipients = 0
+        self.resumed_after = None
+
+    def __repr__(self):
+        return "<FanOutResult email_id=%s batches=%d recipients=%d %.1fs>" % (
+            self.email_id, self.batches, self.recipients, self.elapsed)
+
+
+def recipient_id(email_id, member_id):
+    """SQL expression building a 24 character email_recipients.id
+
+    The id is derived from the email and member so a recipient can only be
+    created once per email.
+    """
+    return func.substr(func.md5(func.concat(email_id, member_id)), 1, 24)
+
+
+def fan_out_email(session, email_id, segment=None, batch_size=1000, member_segment=None):
+    """Creates the email_batches and email_recipients rows of an email.
+
+    Members are walked in primary key order. Each batch of batch_size members
+    becomes one email_batches row and one ``INSERT ... SELECT`` into
+    email_recipients, so member rows never travel to the client. Every batch
+    is committed with its recipients, running the function again for the
+    same email resumes after the last member already fanned out.
+
+    Parameters
+    ----------
+    session : session
+        database session
+    email_id : str
+        id of the emails row
+    segment : str or sqlalchemy expression, optional
+        ghost member filter such as "status:paid+label:vip", always limited to
+        subscribed members, or a condition on Member selecting the
+        recipients, by default subscribed members
+    batch_size : int, optional
+        recipients per email batch, by default 1000
+    member_segment : str, optional
+        value stored in email_batches.member_segment, by default the filter
+        when segment is a string
+
+    Returns
+    -------
+    FanOutResult
+        number of batches and recipients created
+    """
+    if segment is None:
+        segment = Member.subscribed == 1
+    elif isinstance(segment, str):
+        if member_segment is None:
+            member_segment = segment
+        segment = and_(Member.subscribed == 1, compile_filter(segment))
+    result = FanOutResult(email_id)
+
+    query = select(func.max(EmailRecipient.member_id)).filter(EmailRecipient.email_id == email_id)
+    last = result.resumed_after = session.execute(query).scalar()
+    while True:
+        after = Member.id > last if last is not None else true()
+        boundary = session.execute(
+            select(Member.id).filter(segment, after).order_by(Member.id).offset(batch_size - 1).limit(1)
+        ).scalar()
+        if boundary is None:
+            # last, partial batch
+            boundary = session.execute(select(func.max(Member.id)).filter(segment, after)).scalar()
+            if boundary is None:
+                break
+
+        batch_id = object_id()
+        now = datetime.datetime.utcnow()
+        session.execute(insert(EmailBatch.__table__).values(
+            id=batch_id, email_id=email_id, status="pending", member_segment=member_segment,
+            created_at=now, updated_at=now))
+        recipients = select(
+            recipient_id(literal(email_id), Member.id),
+            literal(email_id),
+            Member.id,
+            literal(batch_id),
+            func.coalesce(Member.uuid, ""),
+            Member.email,
+            Member.name,
+        ).filter(and_(segment, after, Member.id <= boundary))
+        columns = ["id", "email_id", "member_id", "batch_id", "member_uuid", "member_email", "member_name"]
+        inserted = session.execute(insert(EmailRecipient.__table__).from_select(columns, recipients))
+        session.commit()
+
+        result.batches += 1
+        result.recipients += inserted.rowcount
+        last = boundary
+
+    result.elapsed = time.perf_counter() - result.started
+    return result
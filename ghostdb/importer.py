@@ -0,0 +1,369 @@
+###############################################################################
+# Copyright (C) 2026, created on October 18, 2026
+# Written by Justin Ho
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This source code is distributed in the hope that it will be useful and
+# without warranty or implied warranty of merchantability or fitness for a
+# particular purpose.
+###############################################################################
+
+import csv
+import datetime
+import json
+import re
+import time
+import uuid
+
+from sqlalchemy import func
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.sql import select
+
+from .schema import Label, Member, MembersLabel
+from .utils import batched, object_id, slugify
+
+email_re = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+truthy = {"1", "true", "yes", "y", "t"}
+falsy = {"0", "false", "no", "n", "f", ""}
+statuses = {"free", "paid", "comped"}
+
+
+class RejectedRow(ValueError):
+    pass
+
+
+class ImportStats:
+    """Counters of a member import"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.finished = None
+        self.read = 0
+        self.imported = 0
+        self.rejected = 0
+        self.batches = 0
+        self.labels_created = 0
+        self.links_created = 0
+
+    @property
+    def elapsed(self):
+        return (self.finished or time.perf_counter()) - self.started
+
+    @property
+    def rows_per_second(self):
+        return self.imported / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self):
+        return {"read": self.read, "imported": self.imported, "rejected": self.rejected,
+                "batches": self.batches, "labels_created": self.labels_created,
+                "links_created": self.links_created, "elapsed": self.elapsed,
+                "rows_per_second": self.rows_per_second}
+
+    def __repr__(self):
+        return ("<ImportStats imported=%d rejected=%d labels_created=%d %.1fs %.0f rows/s>"
+                % (self.imported, self.rejected, self.labels_created, self.elapsed, self.rows_per_second))
+
+
+def read_csv(path):
+    """Reads members from a csv file with a header row, one dict per row"""
+    with open(path, newline="", encoding="utf-8") as f:
+        yield from csv.DictReader(f)
+
+
+def read_jsonl(path):
+    """Reads members from a file with one json object per line"""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def read_members(path):
+    """Reads members from a .csv or .jsonl file depending on the extension"""
+    if path.endswith(".csv"):
+        return read_csv(path)
+    if path.endswith((".jsonl", ".ndjson")):
+        return read_jsonl(path)
+    raise ValueError("unsupported member file %s, expected .csv or .jsonl" % path)
+
+
+def _parse_bool(value):
+    if isinstance(value, bool) or value is None:
+        return value
+    value = str(value).strip().lower()
+    if value in truthy:
+        return True
+    if value in falsy:
+        return False
+    raise RejectedRow("invalid subscribed value %r" % value)
+
+
+def _parse_datetime(value):
+    if not value:
+        return None
+    if isinstance(value, datetime.datetime):
+        return value
+    try:
+        parsed = datetime.datetime.fromisoformat(str(value).strip().replace("Z", "+00:00"))
+    except ValueError:
+        raise RejectedRow("invalid created_at value %r" % value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _parse_labels(value):
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = value.split(",")
+    return [label.strip()[:191] for label in value if label and label.strip()]
+
+
+def clean_member(row):
+    """Validates and normalises one input row
+
+    Parameters
+    ----------
+    row : dict
+        input row with at least an email, optionally name, note, subscribed,
+        status, labels (list or comma separated) and created_at
+
+    Returns
+    -------
+    dict
+        normalised row, subscribed is None when the row does not give it
+
+    Raises
+    ------
+    RejectedRow
+        when the row can not be imported
+    """
+    email = (row.get("email") or "").strip().lower()
+    if not email_re.match(email) or len(email) > 191:
+        raise RejectedRow("invalid email %r" % email)
+    status = (row.get("status") or "free").strip().lower()
+    if status not in statuses:
+        raise RejectedRow("invalid status %r" % status)
+    return {
+        "email": email,
+        "name": (row.get("name") or "").strip()[:191] or None,
+        "note": (row.get("note") or "").strip()[:2000] or None,
+        "status": status,
+        "subscribed": _parse_bool(row.get("subscribed")),
+        "labels": _parse_labels(row.get("labels")),
+        "created_at": _parse_datetime(row.get("created_at")),
+    }
+
+
+def validate_members(rows, stats, on_reject=None):
+    """Filters rows through clean_member, counting and reporting rejects
+
+    Parameters
+    ----------
+    rows : iterable
+        input rows
+    stats : ImportStats
+        counters to update
+    on_reject : callable, optional
+        called as on_reject(row_number, row, reason) for each rejected row
+
+    Yields
+    ------
+    dict
+        normalised rows
+    """
+    for number, row in enumerate(rows, 1):
+        stats.read += 1
+        try:
+            yield clean_member(row)
+        except RejectedRow as e:
+            stats.rejected += 1
+            if on_reject is not None:
+                on_reject(number, row, str(e))
+
+
+class MemberImporter:
+    """Upserts members and their labels in large batches
+
+    Members are written with multi-row ``INSERT ... ON DUPLICATE KEY UPDATE``
+    statements keyed on members.email, one per batch for the rows giving
+    subscribed and one for the rows without it. Existing members keep their
+    id, status and creation date while name, note and subscribed are updated
+    when given, new members without a subscribed value are subscribed.
+    Labels are looked up or created per batch and cached by lower case name,
+    links already present are not duplicated. Each batch is committed on its
+    own so memory stays flat for any input size.
+
+    Parameters
+    ----------
+    session : session
+        database session
+    batch_size : int, optional
+        rows per batch, by default 5000
+    created_by : str, optional
+        user id recorded in created_by and updated_by, by default "1"
+    """
+
+    def __init__(self, session, batch_size=5000, created_by="1"):
+        self.session = session
+        self.batch_size = batch_size
+        self.created_by = created_by
+        self.label_ids = {}
+        self.stats = ImportStats()
+
+    def run(self, rows, on_reject=None, on_progress=None):
+        """Imports rows
+
+        Parameters
+        ----------
+        rows : iterable
+            input rows, see read_members
+        on_reject : callable, optional
+            called as on_reject(row_number, row, reason) for each rejected row
+        on_progress : callable, optional
+            called with the ImportStats after each committed batch
+
+        Returns
+        -------
+        ImportStats
+            counters of the import
+        """
+        for batch in batched(validate_members(rows, self.stats, on_reject), self.batch_size):
+            self.import_batch(batch)
+            self.session.commit()
+            self.stats.batches += 1
+            if on_progress is not None:
+                on_progress(self.stats)
+        self.stats.finished = time.perf_counter()
+        return self.stats
+
+    def import_batch(self, batch):
+        now = datetime.datetime.utcnow()
+        # rows without a subscribed value must not resubscribe existing members
+        given = [row for row in batch if row["subscribed"] is not None]
+        missing = [row for row in batch if row["subscribed"] is None]
+        for rows, update_subscribed in ((given, True), (missing, False)):
+            if rows:
+                self._upsert_members(rows, now, update_subscribed)
+
+        labelled = [row for row in batch if row["labels"]]
+        if labelled:
+            self.link_labels(labelled, now)
+
+    def _upsert_members(self, rows, now, update_subscribed):
+        params = [{
+            "id": object_id(),
+            "uuid": str(uuid.uuid4()),
+            "email": row["email"],
+            "status": row["status"],
+            "name": row["name"],
+            "note": row["note"],
+            "subscribed": True if row["subscribed"] is None else row["subscribed"],
+            "created_at": row["created_at"] or now,
+            "created_by": self.created_by,
+            "updated_at": now,
+            "updated_by": self.created_by,
+        } for row in rows]
+        members = Member.__table__
+        stmt = insert(members)
+        updates = {
+            "name": func.coalesce(stmt.inserted.name, members.c.name),
+            "note": func.coalesce(stmt.inserted.note, members.c.note),
+            "updated_at": stmt.inserted.updated_at,
+            "updated_by": stmt.inserted.updated_by,
+        }
+        if update_subscribed:
+            updates["subscribed"] = stmt.inserted.subscribed
+        self.session.execute(stmt.on_duplicate_key_update(**updates), params)
+        self.stats.imported += len(params)
+
+    def resolve_labels(self, names, now):
+        """Returns label ids by name, creating missing labels
+
+        Names are matched case insensitively, as the default mysql collation
+        compares them, and new labels get a slug no other label uses.
+        """
+        missing = {name.lower(): name for name in sorted(names) if name.lower() not in self.label_ids}
+        if missing:
+            self._load_labels(missing)
+        for attempt in range(4):
+            missing = {key: name for key, name in missing.items() if key not in self.label_ids}
+            if not missing:
+                break
+            if attempt == 3:
+                raise RuntimeError("could not create labels %s" % ", ".join(sorted(missing.values())))
+            slugs = set(self.session.execute(select(Label.slug)).scalars())
+            params = []
+            for key, name in missing.items():
+                base = slug = slugify(name) or object_id()
+                number = 2
+                while slug in slugs:
+                    slug = "%s-%d" % (base, number)
+                    number += 1
+                slugs.add(slug)
+                params.append({"id": object_id(), "name": name, "slug": slug, "created_at": now,
+                               "created_by": self.created_by})
+            # IGNORE keeps concurrent imports creating the same label from failing, the
+            # labels they created are picked up by the reload and a taken slug is retried
+            self.session.execute(insert(Label.__table__).prefix_with("IGNORE"), params)
+            self._load_labels(missing)
+            self.stats.labels_created += sum(1 for row in params
+                                             if self.label_ids.get(row["name"].lower()) == row["id"])
+        return {name: self.label_ids[name.lower()] for name in names if name.lower() in self.label_ids}
+
+    def _load_labels(self, keys):
+        query = select(func.lower(Label.name), Label.id).filter(func.lower(Label.name).in_(list(keys)))
+        self.label_ids.update(self.session.execute(query).all())
+
+    def link_labels(self, rows, now):
+        label_ids = self.resolve_labels({name for row in rows for name in row["labels"]}, now)
+        query = select(Member.email, Member.id).filter(Member.email.in_([row["email"] for row in rows]))
+        member_ids = dict(self.session.execute(query).all())
+        query = select(MembersLabel.member_id, MembersLabel.label_id).filter(
+            MembersLabel.member_id.in_(list(member_ids.values())))
+        existing = set(self.session.execute(query).all())
+
+        params = []
+        for row in rows:
+            member_id = member_ids.get(row["email"])
+            for name in row["labels"]:
+                link = (member_id, label_ids.get(name))
+                if None not in link and link not in existing:
+                    existing.add(link)
+                    params.append({"id": object_id(), "member_id": link[0], "label_id": link[1],
+                                   "sort_order": 0})
+        if params:
+            self.session.execute(insert(MembersLabel.__table__), params)
+            self.stats.links_created += len(params)
+
+
+def import_members(session, path, batch_size=5000, on_reject=None, on_progress=None, created_by="1"):
+    """Imports members from a csv or jsonl file.
+
+    Parameters
+    ----------
+    session : session
+        database session
+    path : str
+        path to a .csv or .jsonl file
+    batch_size : int, optional
+        rows per batch, by default 5000
+    on_reject : callable, optional
+        called as on_reject(row_number, row, reason) for each rejected row
+    on_progress : callable, optional
+        called with the ImportStats after each committed batch
+    created_by : str, optional
+        user id recorded in created_by and updated_by, by default "1"
+
+    Returns
+    -------
+    ImportStats
+        counters of the import
+    """
+    importer = MemberImporter(session, batch_size=batch_size, created_by=created_by)
+    return importer.run(read_members(path), on_reject=on_reject, on_progress=on_progress)
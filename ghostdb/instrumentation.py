@@ -0,0 +1,218 @@
+###############################################################################
+# Copyright (C) 2026, created on October 18, 2026
+# Written by Justin Ho
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This source code is distributed in the hope that it will be useful and
+# without warranty or implied warranty of merchantability or fitness for a
+# particular purpose.
+###############################################################################
+
+import bisect
+import functools
+import logging
+import re
+import threading
+import time
+import weakref
+
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+# upper bounds of the latency histogram buckets in milliseconds, the last bucket is unbounded
+buckets = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+_in_list_re = re.compile(r"\bIN\s*\((?:\s*(?:%s|\?|:\w+|%\(\w+\)s)\s*,?)+\)", re.I)
+_number_re = re.compile(r"\b\d+\b")
+_space_re = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=4096)
+def statement_shape(statement):
+    """Normalises a statement so executions differing only in parameters share a shape
+
+    Parameter lists of IN clauses are collapsed, numeric literals replaced and
+    whitespace squeezed.
+
+    Parameters
+    ----------
+    statement : str
+        statement as sent to the driver
+
+    Returns
+    -------
+    str
+        normalised statement
+    """
+    shape = _in_list_re.sub("IN (...)", statement)
+    shape = _number_re.sub("N", shape)
+    return _space_re.sub(" ", shape).strip()
+
+
+class StatementStats:
+    """Counters of one statement shape"""
+
+    __slots__ = ("shape", "count", "total", "max", "rows", "bytes", "n_plus_one", "histogram")
+
+    def __init__(self, shape):
+        self.shape = shape
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rows = 0
+        self.bytes = 0
+        self.n_plus_one = 0
+        self.histogram = [0] * (len(buckets) + 1)
+
+    def as_dict(self):
+        labels = ["<=%gms" % bound for bound in buckets] + [">%gms" % buckets[-1]]
+        return {
+            "shape": self.shape,
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "n_plus_one": self.n_plus_one,
+            "histogram": {label: count for label, count in zip(labels, self.histogram) if count},
+        }
+
+
+class QueryInstrumentation:
+    """Records what engines execute, per statement shape
+
+    Latency, row counts and, optionally, bytes fetched are aggregated per
+    statement shape. Within one transaction, the unit of work of a session,
+    a SELECT shape executed n_plus_one_threshold times is flagged as a likely
+    N+1 pattern, typically lazy loads of a relationship in a loop, and logged
+    once per transaction. Statements run outside a transaction count until
+    the connection goes back to the pool.
+
+    Parameters
+    ----------
+    n_plus_one_threshold : int, optional
+        executions of the same SELECT shape in one transaction flagged as
+        N+1, by default 10
+    measure_bytes : bool, optional
+        sum the size of fetched rows, only possible with buffered cursors such
+        as the mysqlclient default and costs a pass over each result, by
+        default False
+    """
+
+    def __init__(self, n_plus_one_threshold=10, measure_bytes=False):
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.measure_bytes = measure_bytes
+        self.statements = {}
+        self.n_plus_one = []
+        self.started = time.time()
+        self._engines = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    def attach(self, engine):
+        """Starts recording the statements of engine, attaching twice is a no-op"""
+        if engine in self._engines:
+            return engine
+        self._engines.add(engine)
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine, "begin", self._reset_unit)
+        event.listen(engine, "commit", self._reset_unit)
+        event.listen(engine, "rollback", self._reset_unit)
+        event.listen(engine, "checkout", self._reset_checkout)
+        event.listen(engine, "checkin", self._reset_checkin)
+        return engine
+
+    def detach(self, engine):
+        """Stops recording the statements of engine"""
+        if engine not in self._engines:
+            return
+        self._engines.discard(engine)
+        event.remove(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.remove(engine, "begin", self._reset_unit)
+        event.remove(engine, "commit", self._reset_unit)
+        event.remove(engine, "rollback", self._reset_unit)
+        event.remove(engine, "checkout", self._reset_checkout)
+        event.remove(engine, "checkin", self._reset_checkin)
+
+    def _reset_unit(self, conn):
+        conn.info.pop("ghostdb_unit", None)
+
+    def _reset_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        connection_record.info.pop("ghostdb_unit", None)
+
+    def _reset_checkin(self, dbapi_connection, connection_record):
+        connection_record.info.pop("ghostdb_unit", None)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        # kept on the execution context, a statement that raises leaves nothing behind on the connection
+        context._ghostdb_query_start = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._ghostdb_query_start
+        shape = statement_shape(statement)
+        rows = max(cursor.rowcount, 0)
+        size = self._fetched_bytes(cursor) if self.measure_bytes else 0
+
+        unit = conn.info.setdefault("ghostdb_unit", {})
+        repeats = unit[shape] = unit.get(shape, 0) + 1
+        flagged = repeats == self.n_plus_one_threshold and shape[:6].upper() == "SELECT"
+
+        with self._lock:
+            stats = self.statements.get(shape)
+            if stats is None:
+                stats = self.statements[shape] = StatementStats(shape)
+            stats.count += 1
+            stats.total += elapsed
+            stats.max = max(stats.max, elapsed)
+            stats.rows += rows
+            stats.bytes += size
+            stats.histogram[bisect.bisect_left(buckets, elapsed * 1000)] += 1
+            if flagged:
+                stats.n_plus_one += 1
+                self.n_plus_one.append({"shape": shape, "time": time.time(), "executions": repeats})
+                del self.n_plus_one[:-100]
+        if flagged:
+            logger.warning("possible N+1: statement executed %d times in one transaction: %s", repeats, shape)
+
+    @staticmethod
+    def _fetched_bytes(cursor):
+        rows = getattr(cursor, "_rows", None)
+        if not rows:
+            return 0
+        return sum(len(value) for row in rows for value in row if isinstance(value, (str, bytes)))
+
+    def snapshot(self, reset=False):
+        """Returns the recorded statistics as plain data
+
+        Parameters
+        ----------
+        reset : bool, optional
+            clear the statistics after taking the snapshot, by default False
+
+        Returns
+        -------
+        dict
+            statements sorted by total time and the most recent N+1 detections
+        """
+        with self._lock:
+            snapshot = {
+                "since": self.started,
+                "until": time.time(),
+                "statements": sorted((stats.as_dict() for stats in self.statements.values()),
+                                     key=lambda stats: stats["total"], reverse=True),
+                "n_plus_one": list(self.n_plus_one),
+            }
+            if reset:
+                self.statements = {}
+                self.n_plus_one = []
+                self.started = time.time()
+        return snapshot
+
+    def reset(self):
+        self.snapshot(reset=True)
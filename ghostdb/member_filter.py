@@ -0,0 +1,218 @@
+###############################################################################
+# Copyright (C) 2026, created on October 18, 2026
+# Written by Justin Ho
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This source code is distributed in the hope that it will be useful and
+# without warranty or implied warranty of merchantability or fitness for a
+# particular purpose.
+###############################################################################
+
+import datetime
+import functools
+import re
+
+from sqlalchemy import and_, exists, false, func, not_, or_, true
+from sqlalchemy.sql import select
+
+from .schema import Label, Member, MembersLabel, MembersProduct, Product
+
+# filters stored by older ghost versions in posts.email_recipient_filter
+legacy_filters = {
+    "all": "",
+    "free": "status:free",
+    "paid": "status:-free",
+}
+
+token_re = re.compile(r"""
+    \s*(?:
+        (?P<open>\() | (?P<close>\)) | (?P<and>\+) | (?P<or>,) |
+        (?P<key>[a-z_.]+):\s*(?P<negate>-)?(?P<op>>=|<=|>|<|~)?\s*
+        (?:\[(?P<list>[^\]]*)\] | '(?P<quoted>(?:[^'\\]|\\.)*)' | (?P<value>[^\s+,()]+))
+    )""", re.X)
+
+
+class FilterError(ValueError):
+    pass
+
+
+def _bool(value):
+    return value.lower() in ("true", "1", "yes")
+
+
+def _date(value):
+    try:
+        return datetime.datetime.fromisoformat(value.replace("Z", "+00:00")).replace(tzinfo=None)
+    except ValueError:
+        raise FilterError("invalid date %r" % value)
+
+
+def _column(column, parse):
+    def compile_(op, values):
+        values = [parse(value) for value in values]
+        if op is None:
+            return column.in_(values) if len(values) > 1 else column == values[0]
+        if op == "~":
+            return or_(*(column.contains(value) for value in values))
+        return {">": column > values[0], ">=": column >= values[0], "<": column < values[0],
+                "<=": column <= values[0]}[op]
+    return compile_
+
+
+def _relation(link, link_column, target, target_id):
+    def compile_(op, values):
+        if op is not None:
+            raise FilterError("operator %s is not supported for relations" % op)
+        return exists(select(link.id).join(target, target_id == link_column).filter(
+            link.member_id == Member.id, target.slug.in_(values)).correlate(Member))
+    return compile_
+
+
+# filter key -> function(operator, values) building the condition on Member
+fields = {
+    "id": _column(Member.id, str),
+    "uuid": _column(Member.uuid, str),
+    "email": _column(Member.email, str),
+    "name": _column(Member.name, str),
+    "status": _column(Member.status, str),
+    "subscribed": _column(Member.subscribed, _bool),
+    "email_count": _column(Member.email_count, int),
+    "email_opened_count": _column(Member.email_opened_count, int),
+    "email_open_rate": _column(Member.email_open_rate, int),
+    "created_at": _column(Member.created_at, _date),
+    "updated_at": _column(Member.updated_at, _date),
+    "label": _relation(MembersLabel, MembersLabel.label_id, Label, Label.id),
+    "labels.slug": _relation(MembersLabel, MembersLabel.label_id, Label, Label.id),
+    "product": _relation(MembersProduct, MembersProduct.product_id, Product, Product.id),
+    "products.slug": _relation(MembersProduct, MembersProduct.product_id, Product, Product.id),
+}
+
+
+def _tokens(text):
+    position = 0
+    text = text.strip()
+    while position < len(text):
+        match = token_re.match(text, position)
+        if match is None or match.end() == position:
+            raise FilterError("unexpected %r at position %d" % (text[position:position + 10], position))
+        position = match.end()
+        yield match
+
+
+class _Parser:
+    """recursive descent parser, + binds tighter than , as in ghost's NQL"""
+
+    def __init__(self, text):
+        self.tokens = list(_tokens(text))
+        self.position = 0
+
+    def peek(self):
+        return self.tokens[self.position].lastgroup if self.position < len(self.tokens) else None
+
+    def parse(self):
+        expression = self.parse_or()
+        if self.position != len(self.tokens):
+            raise FilterError("unexpected %r" % self.tokens[self.position].group().strip())
+        return expression
+
+    def parse_or(self):
+        terms = [self.parse_and()]
+        while self.peek() == "or":
+            self.position += 1
+            terms.append(self.parse_and())
+        return terms[0] if len(terms) == 1 else or_(*terms)
+
+    def parse_and(self):
+        terms = [self.parse_term()]
+        while self.peek() == "and":
+            self.position += 1
+            terms.append(self.parse_term())
+        return terms[0] if len(terms) == 1 else and_(*terms)
+
+    def parse_term(self):
+        if self.position >= len(self.tokens):
+            raise FilterError("unexpected end of filter")
+        token = self.tokens[self.position]
+        self.position += 1
+        if token.group("open"):
+            expression = self.parse_or()
+            if self.peek() != "close":
+                raise FilterError("missing )")
+            self.position += 1
+            return expression
+        key = token.group("key")
+        if key is None:
+            raise FilterError("unexpected %r" % token.group().strip())
+        if key not in fields:
+            raise FilterError("unknown filter key %r" % key)
+        if token.group("list") is not None:
+            values = [value.strip().strip("'") for value in token.group("list").split(",") if value.strip()]
+        elif token.group("quoted") is not None:
+            values = [re.sub(r"\\(.)", r"\1", token.group("quoted"))]
+        else:
+            values = [token.group("value")]
+        if not values:
+            raise FilterError("empty value for %r" % key)
+        if values == ["null"] and token.group("op") is None:
+            column = {"email_open_rate": Member.email_open_rate, "name": Member.name, "uuid": Member.uuid,
+                      "updated_at": Member.updated_at}.get(key)
+            if column is None:
+                raise FilterError("null is not supported for %r" % key)
+            condition = column.is_(None)
+        else:
+            condition = fields[key](token.group("op"), values)
+        return not_(condition) if token.group("negate") else condition
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_filter(text):
+    """Compiles a ghost member filter into a condition on Member.
+
+    Supports ``key:value``, negation with ``key:-value``, lists with
+    ``key:[a,b]``, comparisons with ``key:>value`` (>, >=, <, <=), substring
+    matches with ``key:~value``, ``+`` for and, ``,`` for or and
+    parentheses. ``label`` and ``product`` match on slugs. The legacy values
+    all, free, paid and none of posts.email_recipient_filter are accepted as
+    well. Compiled conditions are cached by filter string.
+
+    Parameters
+    ----------
+    text : str
+        filter, for example "status:paid+label:vip"
+
+    Returns
+    -------
+    sqlalchemy expression
+        condition to use in a query on Member
+
+    Raises
+    ------
+    FilterError
+        when the filter can not be parsed
+    """
+    text = (text or "").strip()
+    if text == "none":
+        return false()
+    text = legacy_filters.get(text, text)
+    if not text:
+        return true()
+    return _Parser(text).parse()
+
+
+def select_members(text, *columns):
+    """Returns a select of Member, or of the given columns, matching a filter"""
+    return select(*(columns or (Member,))).filter(compile_filter(text))
+
+
+def count_members(session, text):
+    """Counts the members matching a filter in one query"""
+    return session.execute(select(func.count(Member.id)).filter(compile_filter(text))).scalar()
+
+
+def member_matches(session, member_id, text):
+    """Returns True if the member with member_id matches a filter"""
+    query = select(Member.id).filter(Member.id == member_id, compile_filter(text))
+    return session.execute(query).first() is not None
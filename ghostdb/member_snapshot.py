@@ -0,0 +1,321 @@
+###############################################################################
+# Copyright (C) 2026, created on October 18, 2026
+# Written by Justin Ho
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This source code is distributed in the hope that it will be useful and
+# without warranty or implied warranty of merchantability or fitness for a
+# particular purpose.
+###############################################################################
+
+import array
+import bisect
+import calendar
+import operator
+
+from sqlalchemy import func, or_
+from sqlalchemy.sql import select
+
+from .schema import Label, Member, MembersLabel, MembersProduct, Product
+from .utils import batched
+
+comparisons = {">": operator.gt, ">=": operator.ge, "<": operator.lt, "<=": operator.le, "=": operator.eq}
+
+
+def popcount(bits):
+    """Returns the number of members in a bitmap"""
+    return bin(bits).count("1")
+
+
+def bitmap(rows, size):
+    """Returns a bitmap with the bits of rows set"""
+    data = bytearray((size + 7) // 8)
+    for row in rows:
+        data[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(data, "little")
+
+
+def rows_of(bits):
+    """Yields the rows set in a bitmap, in order"""
+    data = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    for i, byte in enumerate(data):
+        while byte:
+            low = byte & -byte
+            yield (i << 3) + low.bit_length() - 1
+            byte ^= low
+
+
+def timestamp(value):
+    return calendar.timegm(value.timetuple())
+
+
+class MemberSnapshot:
+    """Columnar copy of the members table for segment counts in memory
+
+    Every member gets a row number. The numeric columns are kept in typed
+    arrays (a few bytes per member) and status, subscribed, labels, products
+    and open rate buckets of 10% are bitmaps, python ints with bit n set for
+    the member of row n. A segment is combined from the bitmaps with & and |
+    and counted with popcount, without touching the database, for example
+    the paid, subscribed members with an open rate above 40% and label vip::
+
+        snapshot.count(status="paid", subscribed=True, open_rate=(">", 40), labels=["vip"])
+
+    refresh() only reads the members whose updated_at moved since the last
+    refresh, together with their labels and products, and drops deleted
+    members when the number of members changed. Links added without
+    touching the member are only seen by refresh(full=True).
+
+    Parameters
+    ----------
+    session_factory : callable
+        returns a new database session, for example a sessionmaker
+    batch_size : int, optional
+        members read per query, by default 10000
+    """
+
+    def __init__(self, session_factory, batch_size=10000):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.clear()
+
+    def clear(self):
+        self.ids = []
+        self.rows = {}
+        self.email_count = array.array("I")
+        self.email_opened_count = array.array("I")
+        self.open_rate = array.array("b")
+        self.created_at = array.array("q")
+        self.created_sorted = True
+        self.alive = 0
+        self.status = {}
+        self.subscribed = 0
+        self.open_rate_buckets = {}
+        self.labels = {}
+        self.products = {}
+        self.label_slugs = {}
+        self.product_slugs = {}
+        self.watermark = None
+
+    def __len__(self):
+        return popcount(self.alive)
+
+    def refresh(self, full=False):
+        """Reads the members changed since the last refresh
+
+        Parameters
+        ----------
+        full : bool, optional
+            rebuild the snapshot from scratch, by default False
+
+        Returns
+        -------
+        int
+            number of members read
+        """
+        if full or self.watermark is None:
+            self.clear()
+        session = self.session_factory()
+        try:
+            self.label_slugs = dict(session.execute(select(Label.slug, Label.id)).all())
+            self.product_slugs = dict(session.execute(select(Product.slug, Product.id)).all())
+            watermark = session.execute(select(func.max(Member.updated_at))).scalar()
+            read = self._read_members(session)
+            total = session.execute(select(func.count()).select_from(Member)).scalar()
+            if total != len(self):
+                self._drop_deleted(session)
+        finally:
+            session.close()
+        self.watermark = watermark or self.watermark
+        return read
+
+    def _read_members(self, session):
+        columns = (Member.id, Member.status, Member.subscribed, Member.email_count, Member.email_opened_count,
+                   Member.email_open_rate, Member.created_at)
+        # rows per bitmap, merged into the bitmaps once at the end so a full load stays linear
+        changed = {"members": [], "subscribed": [], "status": {}, "buckets": {}, "labels": {}, "products": {}}
+        cursor = None
+        while True:
+            query = select(*columns)
+            if self.watermark is not None:
+                # >= catches edits made in the same second as the last refresh
+                query = query.filter(or_(Member.updated_at >= self.watermark,
+                                         Member.created_at >= self.watermark))
+            if cursor is not None:
+                query = query.filter(Member.id > cursor)
+            rows = session.execute(query.order_by(Member.id).limit(self.batch_size)).all()
+            if not rows:
+                break
+            cursor = rows[-1].id
+            self._collect(session, rows, changed)
+        self._merge(changed)
+        return len(changed["members"])
+
+    def _row(self, member_id, created_at):
+        row = self.rows.get(member_id)
+        if row is None:
+            row = self.rows[member_id] = len(self.ids)
+            self.ids.append(member_id)
+            self.email_count.append(0)
+            self.email_opened_count.append(0)
+            self.open_rate.append(-1)
+            if self.created_at and created_at < self.created_at[-1]:
+                self.created_sorted = False
+            self.created_at.append(created_at)
+        return row
+
+    def _collect(self, session, members, changed):
+        """Writes a batch of members into the arrays and collects their rows per bitmap"""
+        for member in members:
+            created_at = timestamp(member.created_at)
+            row = self._row(member.id, created_at)
+            self.email_count[row] = member.email_count or 0
+            self.email_opened_count[row] = member.email_opened_count or 0
+            rate = member.email_open_rate
+            self.open_rate[row] = -1 if rate is None else rate
+            self.created_at[row] = created_at
+            changed["members"].append(row)
+            changed["status"].setdefault(member.status, []).append(row)
+            if member.subscribed:
+                changed["subscribed"].append(row)
+            if rate is not None:
+                changed["buckets"].setdefault(min(rate // 10, 10), []).append(row)
+
+        ids = [member.id for member in members]
+        for key, model, column in (("labels", MembersLabel, MembersLabel.label_id),
+                                   ("products", MembersProduct, MembersProduct.product_id)):
+            for chunk in batched(ids, 1000):
+                query = select(model.member_id, column).filter(model.member_id.in_(chunk))
+                for member_id, link_id in session.execute(query):
+                    changed[key].setdefault(link_id, []).append(self.rows[member_id])
+
+    def _merge(self, changed):
+        """Replaces the bits of the changed members in every bitmap"""
+        size = len(self.ids)
+        members = bitmap(changed["members"], size)
+        self.alive |= members
+        self.subscribed = self._replace(self.subscribed, members, changed["subscribed"], size)
+        self._replace_all(self.status, members, changed["status"], size)
+        self._replace_all(self.open_rate_buckets, members, changed["buckets"], size)
+        self._replace_all(self.labels, members, changed["labels"], size)
+        self._replace_all(self.products, members, changed["products"], size)
+
+    def _replace(self, bits, changed, rows, size):
+        return (bits & ~changed) | bitmap(rows, size)
+
+    def _replace_all(self, bitmaps, changed, grouped, size):
+        for key in set(bitmaps) | set(grouped):
+            bitmaps[key] = self._replace(bitmaps.get(key, 0), changed, grouped.get(key, ()), size)
+
+    def _drop_deleted(self, session):
+        """Clears the members that no longer exist from every bitmap"""
+        existing = set(session.execute(select(Member.id)).scalars())
+        gone = [row for member_id, row in self.rows.items() if member_id not in existing]
+        removed = bitmap(gone, len(self.ids))
+        keep = ~removed
+        self.alive &= keep
+        self.subscribed &= keep
+        for bitmaps in (self.status, self.open_rate_buckets, self.labels, self.products):
+            for key in bitmaps:
+                bitmaps[key] &= keep
+
+    def _any(self, bitmaps, slugs, keys):
+        bits = 0
+        for key in keys:
+            bits |= bitmaps.get(slugs.get(key, key), 0)
+        return bits
+
+    def where(self, column, predicate, within=None):
+        """Returns the bitmap of members whose value in an array column passes predicate
+
+        Parameters
+        ----------
+        column : str
+            email_count, email_opened_count, open_rate or created_at
+        predicate : callable
+            called with the value of every member in within
+        within : int, optional
+            bitmap of the members to check, by default every member
+        """
+        values = getattr(self, column)
+        rows = rows_of(self.alive if within is None else within & self.alive)
+        return bitmap((row for row in rows if predicate(values[row])), len(self.ids))
+
+    def _open_rate(self, op, value):
+        compare = comparisons[op]
+        bits = 0
+        for bucket, members in self.open_rate_buckets.items():
+            low, high = bucket * 10, 100 if bucket == 10 else bucket * 10 + 9
+            passing = compare(low, value) + compare(high, value)
+            if passing == 2 and op != "=":
+                bits |= members
+            elif passing or low <= value <= high:
+                bits |= self.where("open_rate", lambda rate: compare(rate, value), members)
+        return bits
+
+    def _created(self, after, before):
+        size = len(self.ids)
+        low = timestamp(after) if after is not None else None
+        high = timestamp(before) if before is not None else None
+        if not self.created_sorted:
+            return self.where("created_at",
+                              lambda value: (low is None or value >= low) and (high is None or value < high))
+        start = bisect.bisect_left(self.created_at, low) if low is not None else 0
+        end = bisect.bisect_left(self.created_at, high) if high is not None else size
+        return ((1 << end) - 1) ^ ((1 << start) - 1) if end > start else 0
+
+    def segment(self, status=None, subscribed=None, labels=None, products=None, open_rate=None,
+                min_emails=None, created_after=None, created_before=None):
+        """Returns the bitmap of the members matching every given criterion
+
+        Parameters
+        ----------
+        status : str or list, optional
+            free, paid or comped, a list matches any of them
+        subscribed : bool, optional
+            subscribed to newsletters or not
+        labels : list, optional
+            label slugs or ids, matches members with any of them
+        products : list, optional
+            product slugs or ids, matches members with any of them
+        open_rate : tuple, optional
+            (operator, percent), for example (">", 40)
+        min_emails : int, optional
+            members that received at least this many emails
+        created_after : datetime, optional
+            members created at or after this time (utc)
+        created_before : datetime, optional
+            members created before this time (utc)
+
+        Returns
+        -------
+        int
+            bitmap, see count and member_ids
+        """
+        bits = self.alive
+        if status is not None:
+            bits &= self._any(self.status, {}, [status] if isinstance(status, str) else status)
+        if subscribed is not None:
+            bits &= self.subscribed if subscribed else ~self.subscribed
+        if labels is not None:
+            bits &= self._any(self.labels, self.label_slugs, labels)
+        if products is not None:
+            bits &= self._any(self.products, self.product_slugs, products)
+        if open_rate is not None:
+            bits &= self._open_rate(*open_rate)
+        if created_after is not None or created_before is not None:
+            bits &= self._created(created_after, created_before)
+        if min_emails is not None:
+            bits &= self.where("email_count", lambda count: count >= min_emails, bits)
+        return bits
+
+    def count(self, **criteria):
+        """Returns the number of members matching criteria, see segment"""
+        return popcount(self.segment(**criteria))
+
+    def member_ids(self, bits):
+        """Returns the ids of the members in a bitmap"""
+        return [self.ids[row] for row in rows_of(bits)]
@@ -0,0 +1,120 @@
+###############################################################################
+# Copyright (C) 2026, created on October 18, 2026
+# Written by Justin Ho
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This source code is distributed in the hope that it will be useful and
+# without warranty or implied warranty of merchantability or fitness for a
+# particular purpose.
+###############################################################################
+
+from sqlalchemy import case, func, or_, true, update
+from sqlalchemy.sql import select
+
+from .schema import EmailRecipient, Member
+from .utils import batched
+
+
+def email_stats_update(condition, min_emails=5):
+    """Builds the UPDATE recomputing the email counters of the matching members
+
+    The assignments are ordered, MySQL evaluates them left to right so the
+    open rate is computed from the counts set just before it.
+
+    Parameters
+    ----------
+    condition : sqlalchemy expression
+        members to update
+    min_emails : int, optional
+        members with fewer emails get no open rate, by default 5
+
+    Returns
+    -------
+    sqlalchemy.sql.Update
+        update statement
+    """
+    recipients = EmailRecipient.__table__
+    members = Member.__table__
+    own = recipients.c.member_id == members.c.id
+    sent = select(func.count(recipients.c.id)).where(own).scalar_subquery()
+    opened = select(func.count(recipients.c.opened_at)).where(own).scalar_subquery()
+    open_rate = case(
+        (members.c.email_count >= min_emails,
+         func.round(members.c.email_opened_count * 100 / members.c.email_count)),
+        else_=None)
+    return update(members).where(condition).ordered_values(
+        (members.c.email_count, sent),
+        (members.c.email_opened_count, opened),
+        (members.c.email_open_rate, open_rate),
+    )
+
+
+def member_ranges(session, chunk_size):
+    """Yields (low, high) primary key ranges of at most chunk_size members, low is exclusive"""
+    low = None
+    while True:
+        after = Member.id > low if low is not None else true()
+        high = session.execute(select(Member.id).filter(after).order_by(Member.id)
+                               .offset(chunk_size - 1).limit(1)).scalar()
+        if high is None:
+            high = session.execute(select(func.max(Member.id)).filter(after)).scalar()
+            if high is None:
+                return
+        yield low, high
+        low = high
+
+
+def active_member_ids(session, since):
+    """Returns the sorted ids of members with recipient activity at or after since
+
+    since has second precision, >= picks up activity recorded in the same
+    second after the previous run started, recounting a member is harmless.
+    """
+    query = select(EmailRecipient.member_id).filter(or_(
+        EmailRecipient.delivered_at >= since,
+        EmailRecipient.opened_at >= since,
+        EmailRecipient.failed_at >= since,
+    )).distinct()
+    return sorted(session.execute(query).scalars())
+
+
+def recompute_email_stats(session, since=None, chunk_size=5000, min_emails=5):
+    """Recomputes members.email_count, email_opened_count and email_open_rate.
+
+    The counters are computed with correlated scalar subqueries over
+    email_recipients, one count per member, and written by one UPDATE per
+    chunk of chunk_size members. Each chunk is committed on its own so row
+    locks are only held briefly.
+
+    Parameters
+    ----------
+    session : session
+        database session
+    since : datetime, optional
+        watermark returned by a previous run, only members with recipients
+        delivered, opened or failed at or after it are updated. All members are
+        updated when not given
+    chunk_size : int, optional
+        members per UPDATE, by default 5000
+    min_emails : int, optional
+        members with fewer emails get no open rate, by default 5
+
+    Returns
+    -------
+    datetime
+        database time at the start of the run, to pass as since next time
+    """
+    watermark = session.execute(select(func.now())).scalar()
+    if since is None:
+        for low, high in list(member_ranges(session, chunk_size)):
+            condition = Member.id <= high if low is None else (Member.id > low) & (Member.id <= high)
+            session.execute(email_stats_update(condition, min_emails))
+            session.commit()
+    else:
+        for ids in batched(active_member_ids(session, since), chunk_size):
+            session.execute(email_stats_update(Member.id.in_(ids), min_emails))
+            session.commit()
+    return watermark
@@ -11,13 +11,14 @@
 # particular purpose.
 ###############################################################################
 
-import bcrypt
 from sqlalchemy.sql import select
 
+from .passwords import check_password, get_verifier
+
 
 class UserMixin:
 
-    def authenticate(self, session, email, password):
+    def authenticate(self, session, email, password, verifier=None, limiter=None):
         """authenticates a user
 
         Parameters
@@ -28,15 +29,89 @@ class UserMixin:
             email string of user
         password : str
             password string of user
+        verifier : PasswordVerifier, optional
+            pool to run the bcrypt check on, by default it runs on the calling thread
+        limiter : RateLimiter, optional
+            rejects emails over their limit of failed attempts before any bcrypt work
 
         Returns
         -------
         bool
             returns True if user is authenticated, False otherwise
         """
+        if limiter is not None and not limiter.allowed(email):
+            return False
         query = select(self.password).filter(self.email == email)
         pw = session.execute(query).scalar()
-        if pw:
-            return bcrypt.checkpw(password.encode('utf-8'), pw)
+        if not pw:
+            authenticated = False
+        elif verifier is not None:
+            authenticated = verifier.verify(password, pw)
         else:
+            authenticated = check_password(password, pw)
+        return self._limit(limiter, email, authenticated)
+
+    async def authenticate_async(self, session, email, password, verifier=None, limiter=None):
+        """authenticates a user through an asyncio session
+
+        The bcrypt check runs on a PasswordVerifier so the event loop is not
+        blocked while hashing.
+
+        Parameters
+        ----------
+        session : AsyncSession
+            asyncio database session, see get_async_session
+        email : str
+            email string of user
+        password : str
+            password string of user
+        verifier : PasswordVerifier, optional
+            pool to run the bcrypt check on, by default the shared get_verifier()
+        limiter : RateLimiter, optional
+            rejects emails over their limit of failed attempts before any bcrypt work
+
+        Returns
+        -------
+        bool
+            returns True if user is authenticated, False otherwise
+        """
+        if limiter is not None and not limiter.allowed(email):
             return False
+        query = select(self.password).filter(self.email == email)
+        pw = (await session.execute(query)).scalar()
+        authenticated = bool(pw) and await (verifier or get_verifier()).verify_async(password, pw)
+        return self._limit(limiter, email, authenticated)
+
+    @staticmethod
+    def _limit(limiter, email, authenticated):
+        """records the outcome of an attempt on the rate limiter"""
+        if limiter is not None:
+            if authenticated:
+                limiter.reset(email)
+            else:
+                limiter.hit(email)
+        return authenticated
+
+    def authenticate_many(self, session, credentials, verifier=None):
+        """authenticates many users, fetching all hashes in one query
+
+        Parameters
+        ----------
+        session : session
+            database session
+        credentials : list
+            (email, password) tuples
+        verifier : PasswordVerifier, optional
+            pool to run the bcrypt checks on, by default the shared get_verifier()
+
+        Returns
+        -------
+        list
+            one bool per credential, in order
+        """
+        emails = {email for email, _ in credentials}
+        query = select(self.email, self.password).filter(self.email.in_(emails))
+        hashes = dict(session.execute(query).all())
+        checks = [(password, hashes[email]) for email, password in credentials if hashes.get(email)]
+        results = iter((verifier or get_verifier()).verify_many(checks))
+        return [next(results) if hashes.get(email) else False for email, _ in credentials]
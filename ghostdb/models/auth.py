@@ -0,0 +1,164 @@
+# coding: utf-8
+# generated by bin/gen-ghost-schema, do not edit
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Integer, String, Text, text
+from sqlalchemy.orm import relationship
+
+from ..mixins import UserMixin
+from .base import Base
+
+
+class ApiKey(Base):
+    __tablename__ = 'api_keys'
+
+    id = Column(String(24), primary_key=True)
+    type = Column(String(50), nullable=False)
+    secret = Column(String(191), nullable=False, unique=True)
+    role_id = Column(String(24))
+    integration_id = Column(String(24))
+    user_id = Column(String(24))
+    last_seen_at = Column(DateTime)
+    last_seen_version = Column(String(50))
+    created_at = Column(DateTime, nullable=False)
+    created_by = Column(String(24), nullable=False)
+    updated_at = Column(DateTime)
+    updated_by = Column(String(24))
+
+
+class Brute(Base):
+    __tablename__ = 'brute'
+
+    key = Column(String(191), primary_key=True)
+    firstRequest = Column(BigInteger, nullable=False)
+    lastRequest = Column(BigInteger, nullable=False)
+    lifetime = Column(BigInteger, nullable=False)
+    count = Column(Integer, nullable=False)
+
+
+class Invite(Base):
+    __tablename__ = 'invites'
+
+    id = Column(String(24), primary_key=True)
+    role_id = Column(String(24), nullable=False)
+    status = Column(String(50), nullable=False, server_default=text("'pending'"))
+    token = Column(String(191), nullable=False, unique=True)
+    email = Column(String(191), nullable=False, unique=True)
+    expires = Column(BigInteger, nullable=False)
+    created_at = Column(DateTime, nullable=False)
+    created_by = Column(String(24), nullable=False)
+    updated_at = Column(DateTime)
+    updated_by = Column(String(24))
+
+
+class Permission(Base):
+    __tablename__ = 'permissions'
+
+    id = Column(String(24), primary_key=True)
+    name = Column(String(50), nullable=False, unique=True)
+    object_type = Column(String(50), nullable=False)
+    action_type = Column(String(50), nullable=False)
+    object_id = Column(String(24))
+    created_at = Column(DateTime, nullable=False)
+    created_by = Column(String(24), nullable=False)
+    updated_at = Column(DateTime)
+    updated_by = Column(String(24))
+
+
+class PermissionsRole(Base):
+    __tablename__ = 'permissions_roles'
+
+    id = Column(String(24), primary_key=True)
+    role_id = Column(String(24), nullable=False)
+    permission_id = Column(String(24), nullable=False)
+
+
+class PermissionsUser(Base):
+    __tablename__ = 'permissions_users'
+
+    id = Column(String(24), primary_key=True)
+    user_id = Column(String(24), nullable=False)
+    permission_id = Column(String(24), nullable=False)
+
+
+class Role(Base):
+    __tablename__ = 'roles'
+
+    id = Column(String(24), primary_key=True)
+    name = Column(String(50), nullable=False, unique=True)
+    description = Column(String(2000))
+    created_at = Column(DateTime, nullable=False)
+    created_by = Column(String(24), nullable=False)
+    updated_at = Column(DateTime)
+    updated_by = Column(String(24))
+
+
+class RolesUser(Base):
+    __tablename__ = 'roles_users'
+
+    id = Column(String(24), primary_key=True)
+    role_id = Column(String(24), nullable=False)
+    user_id = Column(String(24), nullable=False)
+
+
+class Session(Base):
+    __tablename__ = 'sessions'
+
+    id = Column(String(24), primary_key=True)
+    session_id = Column(String(32), nullable=False, unique=True)
+    user_id = Column(String(24), nullable=False)
+    session_data = Column(String(2000), nullable=False)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime)
+
+
+class Token(Base):
+    __tablename__ = 'tokens'
+
+    id = Column(String(24), primary_key=True)
+    token = Column(String(32), nullable=False, index=True)
+    data = Column(String(2000))
+    created_at = Column(DateTime, nullable=False)
+    created_by = Column(String(24), nullable=False)
+
+
+class User(Base, UserMixin):
+    __tablename__ = 'users'
+
+    id = Column(String(24), primary_key=True)
+    name = Column(String(191), nullable=False)
+    slug = Column(String(191), nullable=False, unique=True)
+    password = Column(String(60), nullable=False)
+    email = Column(String(191), nullable=False, unique=True)
+    profile_image = Column(String(2000))
+    cover_image = Column(String(2000))
+    bio = Column(Text)
+    website = Column(String(2000))
+    location = Column(Text)
+    facebook = Column(String(2000))
+    twitter = Column(String(2000))
+    accessibility = Column(Text)
+    status = Column(String(50), nullable=False, server_default=text("'active'"))
+    locale = Column(String(6))
+    visibility = Column(String(50), nullable=False, server_default=text("'public'"))
+    meta_title = Column(String(2000))
+    meta_description = Column(String(2000))
+    tour = Column(Text)
+    last_seen = Column(DateTime)
+    created_at = Column(DateTime, nullable=False)
+    created_by = Column(String(24), nullable=False)
+    updated_at = Column(DateTime)
+    updated_by = Column(String(24))
+
+
+class Oauth(Base):
+    __tablename__ = 'oauth'
+
+    id = Column(String(24), primary_key=True)
+    provider = Column(String(50), nullable=False)
+    provider_id = Column(String(191), nullable=False)
+    access_token = Column(Text)
+    refresh_token = Column(Text)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime)
+    user_id = Column(ForeignKey('users.id'), nullable=False, index=True)
+
+    user = relationship('User')
@@ -0,0 +1,6 @@
+# coding: utf-8
+# generated by bin/gen-ghost-schema, do not edit
+from sqlalchemy.ext.declarative import declarative_base
+
+Base = declarative_base()
+metadata = Base.metadata
@@ -0,0 +1,139 @@
+# coding: utf-8
+# generated by bin/gen-ghost-schema, do not edit
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Index, String, Text, text
+from sqlalchemy.dialects.mysql import INTEGER, LONGTEXT, TINYINT
+from sqlalchemy.orm import deferred, relationship
+
+from .base import Base
+from . import auth  # noqa: F401, relationship and foreign key targets
+
+
+class MobiledocRevision(Base):
+    __tablename__ = 'mobiledoc_revisions'
+
+    id = Column(String(24), primary_key=True)
+    post_id = Column(String(24), nullable=False, index=True)
+    mobiledoc = deferred(Column(LONGTEXT), group='content')
+    created_at_ts = Column(BigInteger, nullable=False)
+    created_at = Column(DateTime, nullable=False)
+
+
+class Post(Base):
+    __tablename__ = 'posts'
+    __table_args__ = (
+        Index('posts_slug_type_unique', 'slug', 'type', unique=True),
+    )
+
+    id = Column(String(24), primary_key=True)
+    uuid = Column(String(36), nullable=False)
+    title = Column(String(2000), nullable=False)
+    slug = Column(String(191), nullable=False)
+    mobiledoc = deferred(Column(LONGTEXT), group='content')
+    html = deferred(Column(LONGTEXT), group='content')
+    comment_id = Column(String(50))
+    plaintext = deferred(Column(LONGTEXT), group='content')
+    feature_image = Column(String(2000))
+    featured = Column(TINYINT(1), nullable=False, server_default=text("'0'"))
+    type = Column(String(50), nullable=False, server_default=text("'post'"))
+    status = Column(String(50), nullable=False, server_default=text("'draft'"))
+    locale = Column(String(6))
+    visibility = Column(String(50), nullable=False, server_default=text("'public'"))
+    email_recipient_filter = Column(String(50), nullable=False, server_default=text("'none'"))
+    author_id = Column(String(24), nullable=False)
+    created_at = Column(DateTime, nullable=False)
+    created_by = Column(String(24), nullable=False)
+    updated_at = Column(DateTime)
+    updated_by = Column(String(24))
+    published_at = Column(DateTime)
+    published_by = Column(String(24))
+    custom_excerpt = Column(String(2000))
+    codeinjection_head = Column(Text)
+    codeinjection_foot = Column(Text)
+    custom_template = Column(String(100))
+    canonical_url = Column(Text)
+
+
+class Snippet(Base):
+    __tablename__ = 'snippets'
+
+    id = Column(String(24), primary_key=True)
+    name = Column(String(191), nullable=False, unique=True)
+    mobiledoc = deferred(Column(LONGTEXT, nullable=False), group='content')
+    created_at = Column(DateTime, nullable=False)
+    created_by = Column(String(24), nullable=False)
+    updated_at = Column(DateTime)
+    updated_by = Column(String(24))
+
+
+class Tag(Base):
+    __tablename__ = 'tags'
+
+    id = Column(String(24), primary_key=True)
+    name = Column(String(191), nullable=False)
+    slug = Column(String(191), nullable=False, unique=True)
+    description = Column(Text)
+    feature_image = Column(String(2000))
+    parent_id = Column(String(191))
+    visibility = Column(String(50), nullable=False, server_default=text("'public'"))
+    og_image = Column(String(2000))
+    og_title = Column(String(300))
+    og_description = Column(String(500))
+    twitter_image = Column(String(2000))
+    twitter_title = Column(String(300))
+    twitter_description = Column(String(500))
+    meta_title = Column(String(2000))
+    meta_description = Column(String(2000))
+    codeinjection_head = Column(Text)
+    codeinjection_foot = Column(Text)
+    canonical_url = Column(String(2000))
+    accent_color = Column(String(50))
+    created_at = Column(DateTime, nullable=False)
+    created_by = Column(String(24), nullable=False)
+    updated_at = Column(DateTime)
+    updated_by = Column(String(24))
+
+
+class PostsAuthor(Base):
+    __tablename__ = 'posts_authors'
+
+    id = Column(String(24), primary_key=True)
+    post_id = Column(ForeignKey('posts.id'), nullable=False, index=True)
+    author_id = Column(ForeignKey('users.id'), nullable=False, index=True)
+    sort_order = Column(INTEGER, nullable=False, server_default=text("'0'"))
+
+    author = relationship('User')
+    post = relationship('Post')
+
+
+class PostsMeta(Base):
+    __tablename__ = 'posts_meta'
+
+    id = Column(String(24), primary_key=True)
+    post_id = Column(ForeignKey('posts.id'), nullable=False, unique=True)
+    og_image = Column(String(2000))
+    og_title = Column(String(300))
+    og_description = Column(String(500))
+    twitter_image = Column(String(2000))
+    twitter_title = Column(String(300))
+    twitter_description = Column(String(500))
+    meta_title = Column(String(2000))
+    meta_description = Column(String(2000))
+    email_subject = Column(String(300))
+    frontmatter = Column(Text)
+    feature_image_alt = Column(String(191))
+    feature_image_caption = Column(Text)
+    email_only = Column(TINYINT(1), nullable=False, server_default=text("'0'"))
+
+    post = relationship('Post')
+
+
+class PostsTag(Base):
+    __tablename__ = 'posts_tags'
+
+    id = Column(String(24), primary_key=True)
+    post_id = Column(ForeignKey('posts.id'), nullable=False, index=True)
+    tag_id = Column(ForeignKey('tags.id'), nullable=False, index=True)
+    sort_order = Column(INTEGER, nullable=False, server_default=text("'0'"))
+
+    post = relationship('Post')
+    tag = relationship('Tag')
@@ -0,0 +1,103 @@
+# coding: utf-8
+# generated by bin/gen-ghost-schema, do not edit
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String, Text, text
+from sqlalchemy.dialects.mysql import INTEGER, TINYINT
+from sqlalchemy.orm import relationship
+
+from .base import Base
+
+
+class Action(Base):
+    __tablename__ = 'actions'
+
+    id = Column(String(24), primary_key=True)
+    resource_id = Column(String(24))
+    resource_type = Column(String(50), nullable=False)
+    actor_id = Column(String(24), nullable=False)
+    actor_type = Column(String(50), nullable=False)
+    event = Column(String(50), nullable=False)
+    context = Column(Text)
+    created_at = Column(DateTime, nullable=False)
+
+
+class CustomThemeSetting(Base):
+    __tablename__ = 'custom_theme_settings'
+
+    id = Column(String(24), primary_key=True)
+    theme = Column(String(191), nullable=False)
+    key = Column(String(191), nullable=False)
+    type = Column(String(50), nullable=False)
+    value = Column(Text)
+
+
+class Integration(Base):
+    __tablename__ = 'integrations'
+
+    id = Column(String(24), primary_key=True)
+    type = Column(String(50), nullable=False, server_default=text("'custom'"))
+    name = Column(String(191), nullable=False)
+    slug = Column(String(191), nullable=False, unique=True)
+    icon_image = Column(String(2000))
+    description = Column(String(2000))
+    created_at = Column(DateTime, nullable=False)
+    created_by = Column(String(24), nullable=False)
+    updated_at = Column(DateTime)
+    updated_by = Column(String(24))
+
+
+class Migration(Base):
+    __tablename__ = 'migrations'
+    __table_args__ = (
+        Index('migrations_name_version_unique', 'name', 'version', unique=True),
+    )
+
+    id = Column(INTEGER, primary_key=True)
+    name = Column(String(120), nullable=False)
+    version = Column(String(70), nullable=False)
+    currentVersion = Column(String(255))
+
+
+class MigrationsLock(Base):
+    __tablename__ = 'migrations_lock'
+
+    lock_key = Column(String(191), primary_key=True)
+    locked = Column(TINYINT(1), server_default=text("'0'"))
+    acquired_at = Column(DateTime)
+    released_at = Column(DateTime)
+
+
+class Setting(Base):
+    __tablename__ = 'settings'
+
+    id = Column(String(24), primary_key=True)
+    group = Column(String(50), nullable=False, server_default=text("'core'"))
+    key = Column(String(50), nullable=False, unique=True)
+    value = Column(Text)
+    type = Column(String(50), nullable=False)
+    flags = Column(String(50))
+    created_at = Column(DateTime, nullable=False)
+    created_by = Column(String(24), nullable=False)
+    updated_at = Column(DateTime)
+    updated_by = Column(String(24))
+
+
+class Webhook(Base):
+    __tablename__ = 'webhooks'
+
+    id = Column(String(24), primary_key=True)
+    event = Column(String(50), nullable=False)
+    target_url = Column(String(2000), nullable=False)
+    name = Column(String(191))
+    secret = Column(String(191))
+    api_version = Column(String(50), nullable=False, server_default=text("'v2'"))
+    integration_id = Column(ForeignKey('integrations.id', ondelete='CASCADE'), nullable=False, index=True)
+    status = Column(String(50), nullable=False, server_default=text("'available'"))
+    last_triggered_at = Column(DateTime)
+    last_triggered_status = Column(String(50))
+    last_triggered_error = Column(String(50))
+    created_at = Column(DateTime, nullable=False)
+    created_by = Column(String(24), nullable=False)
+    updated_at = Column(DateTime)
+    updated_by = Column(String(24))
+
+    integration = relationship('Integration')
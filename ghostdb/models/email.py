@@ -0,0 +1,70 @@
+# coding: utf-8
+# generated by bin/gen-ghost-schema, do not edit
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String, Text, text
+from sqlalchemy.dialects.mysql import INTEGER, LONGTEXT, TINYINT
+from sqlalchemy.orm import deferred, relationship
+
+from .base import Base
+
+
+class Email(Base):
+    __tablename__ = 'emails'
+
+    id = Column(String(24), primary_key=True)
+    post_id = Column(String(24), nullable=False, unique=True)
+    uuid = Column(String(36), nullable=False)
+    status = Column(String(50), nullable=False, server_default=text("'pending'"))
+    recipient_filter = Column(String(50), nullable=False, server_default=text("'status:-free'"))
+    error = Column(String(2000))
+    error_data = deferred(Column(LONGTEXT), group='content')
+    email_count = Column(INTEGER, nullable=False, server_default=text("'0'"))
+    delivered_count = Column(INTEGER, nullable=False, server_default=text("'0'"))
+    opened_count = Column(INTEGER, nullable=False, server_default=text("'0'"))
+    failed_count = Column(INTEGER, nullable=False, server_default=text("'0'"))
+    subject = Column(String(300))
+    _from = Column('from', String(2000))
+    reply_to = Column(String(2000))
+    html = deferred(Column(LONGTEXT), group='content')
+    plaintext = deferred(Column(LONGTEXT), group='content')
+    track_opens = Column(TINYINT(1), nullable=False, server_default=text("'0'"))
+    submitted_at = Column(DateTime, nullable=False)
+    created_at = Column(DateTime, nullable=False)
+    created_by = Column(String(24), nullable=False)
+    updated_at = Column(DateTime)
+    updated_by = Column(String(24))
+
+
+class EmailBatch(Base):
+    __tablename__ = 'email_batches'
+
+    id = Column(String(24), primary_key=True)
+    email_id = Column(ForeignKey('emails.id'), nullable=False, index=True)
+    provider_id = Column(String(255))
+    status = Column(String(50), nullable=False, server_default=text("'pending'"))
+    member_segment = Column(Text)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+
+    email = relationship('Email')
+
+
+class EmailRecipient(Base):
+    __tablename__ = 'email_recipients'
+    __table_args__ = (
+        Index('email_recipients_email_id_member_email_index', 'email_id', 'member_email'),
+    )
+
+    id = Column(String(24), primary_key=True)
+    email_id = Column(ForeignKey('emails.id'), nullable=False)
+    member_id = Column(String(24), nullable=False, index=True)
+    batch_id = Column(ForeignKey('email_batches.id'), nullable=False, index=True)
+    processed_at = Column(DateTime)
+    delivered_at = Column(DateTime, index=True)
+    opened_at = Column(DateTime, index=True)
+    failed_at = Column(DateTime, index=True)
+    member_uuid = Column(String(36), nullable=False)
+    member_email = Column(String(191), nullable=False)
+    member_name = Column(String(191))
+
+    batch = relationship('EmailBatch')
+    email = relationship('Email')
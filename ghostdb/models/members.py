@@ -0,0 +1,198 @@
+# coding: utf-8
+# generated by bin/gen-ghost-schema, do not edit
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, text
+from sqlalchemy.dialects.mysql import INTEGER, TINYINT
+from sqlalchemy.orm import relationship
+
+from .base import Base
+
+
+class Benefit(Base):
+    __tablename__ = 'benefits'
+
+    id = Column(String(24), primary_key=True)
+    name = Column(String(191), nullable=False)
+    slug = Column(String(191), nullable=False, unique=True)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime)
+
+
+class Label(Base):
+    __tablename__ = 'labels'
+
+    id = Column(String(24), primary_key=True)
+    name = Column(String(191), nullable=False, unique=True)
+    slug = Column(String(191), nullable=False, unique=True)
+    created_at = Column(DateTime, nullable=False)
+    created_by = Column(String(24), nullable=False)
+    updated_at = Column(DateTime)
+    updated_by = Column(String(24))
+
+
+class Member(Base):
+    __tablename__ = 'members'
+
+    id = Column(String(24), primary_key=True)
+    uuid = Column(String(36), unique=True)
+    email = Column(String(191), nullable=False, unique=True)
+    status = Column(String(50), nullable=False, server_default=text("'free'"))
+    name = Column(String(191))
+    note = Column(String(2000))
+    geolocation = Column(String(2000))
+    subscribed = Column(TINYINT(1), server_default=text("'1'"))
+    email_count = Column(INTEGER, nullable=False, server_default=text("'0'"))
+    email_opened_count = Column(INTEGER, nullable=False, server_default=text("'0'"))
+    email_open_rate = Column(INTEGER, index=True)
+    created_at = Column(DateTime, nullable=False)
+    created_by = Column(String(24), nullable=False)
+    updated_at = Column(DateTime)
+    updated_by = Column(String(24))
+
+
+class Product(Base):
+    __tablename__ = 'products'
+
+    id = Column(String(24), primary_key=True)
+    name = Column(String(191), nullable=False)
+    slug = Column(String(191), nullable=False, unique=True)
+    monthly_price_id = Column(String(24))
+    yearly_price_id = Column(String(24))
+    description = Column(String(191))
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime)
+
+
+class TempMemberAnalyticEvent(Base):
+    __tablename__ = 'temp_member_analytic_events'
+
+    id = Column(String(24), primary_key=True)
+    event_name = Column(String(50), nullable=False)
+    created_at = Column(DateTime, nullable=False)
+    member_id = Column(String(24), nullable=False)
+    member_status = Column(String(50), nullable=False)
+    entry_id = Column(String(24))
+    source_url = Column(String(2000))
+    metadata_ = Column('metadata', String(191))
+
+
+class MembersEmailChangeEvent(Base):
+    __tablename__ = 'members_email_change_events'
+
+    id = Column(String(24), primary_key=True)
+    member_id = Column(ForeignKey('members.id', ondelete='CASCADE'), nullable=False, index=True)
+    to_email = Column(String(191), nullable=False)
+    from_email = Column(String(191), nullable=False)
+    created_at = Column(DateTime, nullable=False)
+
+    member = relationship('Member')
+
+
+class MembersLabel(Base):
+    __tablename__ = 'members_labels'
+
+    id = Column(String(24), primary_key=True)
+    member_id = Column(ForeignKey('members.id', ondelete='CASCADE'), nullable=False, index=True)
+    label_id = Column(ForeignKey('labels.id', ondelete='CASCADE'), nullable=False, index=True)
+    sort_order = Column(INTEGER, nullable=False, server_default=text("'0'"))
+
+    label = relationship('Label')
+    member = relationship('Member')
+
+
+class MembersLoginEvent(Base):
+    __tablename__ = 'members_login_events'
+
+    id = Column(String(24), primary_key=True)
+    member_id = Column(ForeignKey('members.id', ondelete='CASCADE'), nullable=False, index=True)
+    created_at = Column(DateTime, nullable=False)
+
+    member = relationship('Member')
+
+
+class MembersPaidSubscriptionEvent(Base):
+    __tablename__ = 'members_paid_subscription_events'
+
+    id = Column(String(24), primary_key=True)
+    member_id = Column(ForeignKey('members.id', ondelete='CASCADE'), nullable=False, index=True)
+    from_plan = Column(String(255))
+    to_plan = Column(String(255))
+    currency = Column(String(191), nullable=False)
+    source = Column(String(50), nullable=False)
+    mrr_delta = Column(Integer, nullable=False)
+    created_at = Column(DateTime, nullable=False)
+
+    member = relationship('Member')
+
+
+class MembersPaymentEvent(Base):
+    __tablename__ = 'members_payment_events'
+
+    id = Column(String(24), primary_key=True)
+    member_id = Column(ForeignKey('members.id', ondelete='CASCADE'), nullable=False, index=True)
+    amount = Column(Integer, nullable=False)
+    currency = Column(String(191), nullable=False)
+    source = Column(String(50), nullable=False)
+    created_at = Column(DateTime, nullable=False)
+
+    member = relationship('Member')
+
+
+class MembersProductEvent(Base):
+    __tablename__ = 'members_product_events'
+
+    id = Column(String(24), primary_key=True)
+    member_id = Column(ForeignKey('members.id', ondelete='CASCADE'), nullable=False, index=True)
+    product_id = Column(ForeignKey('products.id'), nullable=False, index=True)
+    action = Column(String(50))
+    created_at = Column(DateTime, nullable=False)
+
+    member = relationship('Member')
+    product = relationship('Product')
+
+
+class MembersProduct(Base):
+    __tablename__ = 'members_products'
+
+    id = Column(String(24), primary_key=True)
+    member_id = Column(ForeignKey('members.id', ondelete='CASCADE'), nullable=False, index=True)
+    product_id = Column(ForeignKey('products.id', ondelete='CASCADE'), nullable=False, index=True)
+    sort_order = Column(INTEGER, nullable=False, server_default=text("'0'"))
+
+    member = relationship('Member')
+    product = relationship('Product')
+
+
+class MembersStatusEvent(Base):
+    __tablename__ = 'members_status_events'
+
+    id = Column(String(24), primary_key=True)
+    member_id = Column(ForeignKey('members.id', ondelete='CASCADE'), nullable=False, index=True)
+    from_status = Column(String(50))
+    to_status = Column(String(50))
+    created_at = Column(DateTime, nullable=False)
+
+    member = relationship('Member')
+
+
+class MembersSubscribeEvent(Base):
+    __tablename__ = 'members_subscribe_events'
+
+    id = Column(String(24), primary_key=True)
+    member_id = Column(ForeignKey('members.id', ondelete='CASCADE'), nullable=False, index=True)
+    subscribed = Column(TINYINT(1), nullable=False, server_default=text("'1'"))
+    created_at = Column(DateTime, nullable=False)
+    source = Column(String(50))
+
+    member = relationship('Member')
+
+
+class ProductsBenefit(Base):
+    __tablename__ = 'products_benefits'
+
+    id = Column(String(24), primary_key=True)
+    product_id = Column(ForeignKey('products.id', ondelete='CASCADE'), nullable=False, index=True)
+    benefit_id = Column(ForeignKey('benefits.id', ondelete='CASCADE'), nullable=False, index=True)
+    sort_order = Column(INTEGER, nullable=False, server_default=text("'0'"))
+
+    benefit = relationship('Benefit')
+    product = relationship('Product')
@@ -0,0 +1,118 @@
+# coding: utf-8
+# generated by bin/gen-ghost-schema, do not edit
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, text
+from sqlalchemy.dialects.mysql import TINYINT
+from sqlalchemy.orm import relationship
+
+from .base import Base
+from . import members  # noqa: F401, relationship and foreign key targets
+
+
+class MembersStripeCustomer(Base):
+    __tablename__ = 'members_stripe_customers'
+
+    id = Column(String(24), primary_key=True)
+    member_id = Column(ForeignKey('members.id', ondelete='CASCADE'), nullable=False, index=True)
+    customer_id = Column(String(255), nullable=False, unique=True)
+    name = Column(String(191))
+    email = Column(String(191))
+    created_at = Column(DateTime, nullable=False)
+    created_by = Column(String(24), nullable=False)
+    updated_at = Column(DateTime)
+    updated_by = Column(String(24))
+
+    member = relationship('Member')
+
+
+class Offer(Base):
+    __tablename__ = 'offers'
+
+    id = Column(String(24), primary_key=True)
+    active = Column(TINYINT(1), nullable=False, server_default=text("'1'"))
+    name = Column(String(191), nullable=False, unique=True)
+    code = Column(String(191), nullable=False, unique=True)
+    product_id = Column(ForeignKey('products.id'), nullable=False, index=True)
+    stripe_coupon_id = Column(String(255), unique=True)
+    interval = Column(String(50), nullable=False)
+    currency = Column(String(50))
+    discount_type = Column(String(50), nullable=False)
+    discount_amount = Column(Integer, nullable=False)
+    duration = Column(String(50), nullable=False)
+    duration_in_months = Column(Integer)
+    portal_title = Column(String(191))
+    portal_description = Column(String(2000))
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime)
+
+    product = relationship('Product')
+
+
+class StripeProduct(Base):
+    __tablename__ = 'stripe_products'
+
+    id = Column(String(24), primary_key=True)
+    product_id = Column(ForeignKey('products.id'), nullable=False, index=True)
+    stripe_product_id = Column(String(255), nullable=False, unique=True)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime)
+
+    product = relationship('Product')
+
+
+class MembersStripeCustomersSubscription(Base):
+    __tablename__ = 'members_stripe_customers_subscriptions'
+
+    id = Column(String(24), primary_key=True)
+    customer_id = Column(ForeignKey('members_stripe_customers.customer_id', ondelete='CASCADE'), nullable=False, index=True)
+    subscription_id = Column(String(255), nullable=False, unique=True)
+    stripe_price_id = Column(String(255), nullable=False, index=True, server_default=text("''"))
+    status = Column(String(50), nullable=False)
+    cancel_at_period_end = Column(TINYINT(1), nullable=False, server_default=text("'0'"))
+    cancellation_reason = Column(String(500))
+    current_period_end = Column(DateTime, nullable=False)
+    start_date = Column(DateTime, nullable=False)
+    default_payment_card_last4 = Column(String(4))
+    created_at = Column(DateTime, nullable=False)
+    created_by = Column(String(24), nullable=False)
+    updated_at = Column(DateTime)
+    updated_by = Column(String(24))
+    plan_id = Column(String(255), nullable=False)
+    plan_nickname = Column(String(50), nullable=False)
+    plan_interval = Column(String(50), nullable=False)
+    plan_amount = Column(Integer, nullable=False)
+    plan_currency = Column(String(191), nullable=False)
+
+    customer = relationship('MembersStripeCustomer')
+
+
+class StripePrice(Base):
+    __tablename__ = 'stripe_prices'
+
+    id = Column(String(24), primary_key=True)
+    stripe_price_id = Column(String(255), nullable=False, unique=True)
+    stripe_product_id = Column(ForeignKey('stripe_products.stripe_product_id'), nullable=False, index=True)
+    active = Column(TINYINT(1), nullable=False)
+    nickname = Column(String(50))
+    currency = Column(String(191), nullable=False)
+    amount = Column(Integer, nullable=False)
+    type = Column(String(50), nullable=False, server_default=text("'recurring'"))
+    interval = Column(String(50))
+    description = Column(String(191))
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime)
+
+    stripe_product = relationship('StripeProduct')
+
+
+class OfferRedemption(Base):
+    __tablename__ = 'offer_redemptions'
+
+    id = Column(String(24), primary_key=True)
+    offer_id = Column(ForeignKey('offers.id', ondelete='CASCADE'), nullable=False, index=True)
+    member_id = Column(ForeignKey('members.id', ondelete='CASCADE'), nullable=False, index=True)
+    subscription_id = Column(ForeignKey('members_stripe_customers_subscriptions.id', ondelete='CASCADE'), nullable=False, index=True)
+    created_at = Column(DateTime, nullable=False)
+
+    member = relationship('Member')
+    offer = relationship('Offer')
+    subscription = relationship('MembersStripeCustomersSubscription')
@@ -0,0 +1,207 @@
+###############################################################################
+# Copyright (C) 2026, created on October 18, 2026
+# Written by Justin Ho
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This source code is distributed in the hope that it will be useful and
+# without warranty or implied warranty of merchantability or fitness for a
+# particular purpose.
+###############################################################################
+
+import asyncio
+import collections
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import bcrypt
+
+_verifier = None
+_lock = threading.Lock()
+
+
+def check_password(password, pw):
+    """checks a plain text password against a stored bcrypt hash
+
+    Parameters
+    ----------
+    password : str
+        password string of user
+    pw : str or bytes
+        bcrypt hash as stored in users.password, drivers differ on returning str or bytes
+
+    Returns
+    -------
+    bool
+        returns True if the password matches the hash
+    """
+    if isinstance(pw, str):
+        pw = pw.encode('utf-8')
+    return bcrypt.checkpw(password.encode('utf-8'), pw)
+
+
+def _timed_check_password(password, pw):
+    start = time.perf_counter()
+    return check_password(password, pw), time.perf_counter() - start
+
+
+class PasswordVerifier:
+    """Runs bcrypt checks on a dedicated pool with a cap on queued checks
+
+    bcrypt releases the GIL while hashing so a thread pool spreads checks over
+    several cores, a process pool can be used instead when the hashing should
+    not compete with the calling interpreter at all.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        number of checks running at the same time, by default 4
+    max_pending : int, optional
+        number of checks accepted at the same time, running or queued, callers
+        wait for a free slot beyond that, by default 4 times max_workers
+    use_processes : bool, optional
+        run checks in a process pool instead of a thread pool, by default False
+    latency_window : int, optional
+        number of recent checks kept for the latency percentiles, by default 1000
+    """
+
+    def __init__(self, max_workers=4, max_pending=None, use_processes=False, latency_window=1000):
+        executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        self.executor = executor_class(max_workers=max_workers)
+        self.max_workers = max_workers
+        self.max_pending = max_pending or 4 * max_workers
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._lock = threading.Lock()
+        self._latencies = collections.deque(maxlen=latency_window)
+        self._hash_times = collections.deque(maxlen=latency_window)
+        self.checks = 0
+        self.matches = 0
+        self.in_flight = 0
+
+    def submit(self, password, pw):
+        """Schedules a check, waiting for a free slot when max_pending checks are in flight
+
+        Parameters
+        ----------
+        password : str
+            password string of user
+        pw : str or bytes
+            stored bcrypt hash
+
+        Returns
+        -------
+        concurrent.futures.Future
+            future resolving to True if the password matches
+        """
+        self._slots.acquire()
+        return self._submit(password, pw)
+
+    def _submit(self, password, pw):
+        start = time.perf_counter()
+        with self._lock:
+            self.in_flight += 1
+        try:
+            inner = self.executor.submit(_timed_check_password, password, pw)
+        except BaseException:
+            self._done()
+            raise
+        future = inner.__class__()
+
+        def finish(inner):
+            self._done()
+            error = inner.exception()
+            if error is None:
+                matched, hash_time = inner.result()
+                with self._lock:
+                    self.checks += 1
+                    self.matches += matched
+                    self._latencies.append(time.perf_counter() - start)
+                    self._hash_times.append(hash_time)
+            # the caller may have cancelled, for example verify_async timing out
+            if not future.set_running_or_notify_cancel():
+                return
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(matched)
+
+        inner.add_done_callback(finish)
+        return future
+
+    def _done(self):
+        with self._lock:
+            self.in_flight -= 1
+        self._slots.release()
+
+    def verify(self, password, pw):
+        """Checks a password on the pool and waits for the result"""
+        return self.submit(password, pw).result()
+
+    async def verify_async(self, password, pw):
+        """Checks a password on the pool without blocking the event loop
+
+        While the pool is full the coroutine retries with a growing sleep of
+        up to 20ms, so waiting takes no executor thread and a cancelled wait
+        never holds a slot.
+        """
+        delay = 0.001
+        while not self._slots.acquire(blocking=False):
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.02)
+        return await asyncio.wrap_future(self._submit(password, pw))
+
+    def verify_many(self, pairs):
+        """Checks many passwords, at most max_pending at a time
+
+        Parameters
+        ----------
+        pairs : iterable
+            (password, hash) tuples
+
+        Returns
+        -------
+        list
+            one bool per pair, in order
+        """
+        futures = [self.submit(password, pw) for password, pw in pairs]
+        return [future.result() for future in futures]
+
+    def metrics(self):
+        """Returns counters and latency percentiles in seconds
+
+        latency is measured from submission to result, so includes queueing,
+        hash_time is the time spent in bcrypt alone.
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+            hash_times = sorted(self._hash_times)
+            metrics = {"checks": self.checks, "matches": self.matches, "in_flight": self.in_flight,
+                       "max_workers": self.max_workers, "max_pending": self.max_pending}
+        for name, values in (("latency", latencies), ("hash_time", hash_times)):
+            for percentile in (50, 95, 99):
+                index = min(len(values) - 1, len(values) * percentile // 100)
+                metrics["%s_p%d" % (name, percentile)] = values[index] if values else 0.0
+            metrics["%s_max" % name] = values[-1] if values else 0.0
+        return metrics
+
+    def shutdown(self, wait=True):
+        self.executor.shutdown(wait=wait)
+
+
+def get_verifier(**kwargs):
+    """Gets the shared PasswordVerifier, creating it with kwargs on first use.
+
+    Returns
+    -------
+    PasswordVerifier
+        verifier shared by the authenticate methods
+    """
+    global _verifier
+    if _verifier is None:
+        with _lock:
+            if _verifier is None:
+                _verifier = PasswordVerifier(**kwargs)
+    return _verifier
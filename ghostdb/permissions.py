@@ -0,0 +1,147 @@
+###############################################################################
+# Copyright (C) 2026, created on October 18, 2026
+# Written by Justin Ho
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This source code is distributed in the hope that it will be useful and
+# without warranty or implied warranty of merchantability or fitness for a
+# particular purpose.
+###############################################################################
+
+import collections
+import threading
+import time
+
+from sqlalchemy import func
+from sqlalchemy.sql import select
+
+from .schema import Permission, PermissionsRole, PermissionsUser, Role, RolesUser
+
+# table -> columns loaded, the first column is the primary key
+tables = {
+    "roles": (Role.id, Role.name),
+    "roles_users": (RolesUser.id, RolesUser.role_id, RolesUser.user_id),
+    "permissions": (Permission.id, Permission.action_type, Permission.object_type),
+    "permissions_roles": (PermissionsRole.id, PermissionsRole.role_id, PermissionsRole.permission_id),
+    "permissions_users": (PermissionsUser.id, PermissionsUser.user_id, PermissionsUser.permission_id),
+}
+
+
+def table_signature(columns):
+    """SQL expression summarising the rows of a table, changes when rows are added, removed or edited"""
+    checksum = func.coalesce(func.bit_xor(func.crc32(func.concat_ws(":", *columns))), 0)
+    return select(func.concat(func.count(), "/", checksum)).scalar_subquery()
+
+
+class PermissionCache:
+    """Effective permissions of every user, compiled in memory
+
+    The role and permission tables are loaded once and each user's
+    permissions, granted directly or through their roles, are compiled into
+    an integer bitmask over the (action_type, object_type) pairs, so a check
+    is a dictionary lookup and a bit test. Users with a role in
+    superuser_roles are allowed everything, like the ghost owner.
+
+    Once ttl has elapsed, the next check compares a checksum of each table,
+    all in one query, and reloads only the tables that changed.
+
+    Parameters
+    ----------
+    session_factory : callable
+        returns a new database session, for example a sessionmaker
+    ttl : float, optional
+        seconds between checks for changes, by default 30
+    superuser_roles : tuple, optional
+        names of roles allowed everything, by default ("Owner",)
+    """
+
+    def __init__(self, session_factory, ttl=30.0, superuser_roles=("Owner",)):
+        self.session_factory = session_factory
+        self.ttl = ttl
+        self.superuser_roles = frozenset(superuser_roles)
+        self.rows = {table: [] for table in tables}
+        self.signatures = {}
+        self.bits = {}
+        self.masks = {}
+        self.user_roles = {}
+        self.superusers = frozenset()
+        self.checked_at = None
+        self._lock = threading.Lock()
+
+    def can(self, user_id, action_type, object_type):
+        """Returns True if the user may perform action_type on object_type"""
+        self._maybe_refresh()
+        if user_id in self.superusers:
+            return True
+        bit = self.bits.get((action_type, object_type))
+        return bit is not None and self.masks.get(user_id, 0) >> bit & 1 == 1
+
+    def permissions(self, user_id):
+        """Returns the (action_type, object_type) pairs the user is granted"""
+        self._maybe_refresh()
+        mask = self.masks.get(user_id, 0)
+        return frozenset(key for key, bit in self.bits.items() if mask >> bit & 1)
+
+    def roles(self, user_id):
+        """Returns the names of the user's roles"""
+        self._maybe_refresh()
+        return self.user_roles.get(user_id, frozenset())
+
+    def _maybe_refresh(self):
+        if self.checked_at is None:
+            self.refresh()
+        elif time.monotonic() - self.checked_at >= self.ttl and self._lock.acquire(blocking=False):
+            try:
+                self._refresh()
+            finally:
+                self._lock.release()
+
+    def refresh(self):
+        """Checks the tables for changes now"""
+        with self._lock:
+            self._refresh()
+
+    def _refresh(self):
+        session = self.session_factory()
+        try:
+            names = list(tables)
+            signatures = dict(zip(names, session.execute(
+                select(*(table_signature(tables[name]) for name in names))).one()))
+            changed = [name for name in names if signatures[name] != self.signatures.get(name)]
+            for name in changed:
+                self.rows[name] = session.execute(select(*tables[name])).all()
+        finally:
+            session.close()
+        if changed:
+            self._compile()
+        self.signatures = signatures
+        self.checked_at = time.monotonic()
+
+    def _compile(self):
+        permissions = {row.id: (row.action_type, row.object_type) for row in self.rows["permissions"]}
+        bits = {key: bit for bit, key in enumerate(sorted(set(permissions.values())))}
+        permission_bits = {permission_id: 1 << bits[key] for permission_id, key in permissions.items()}
+
+        role_masks = collections.defaultdict(int)
+        for row in self.rows["permissions_roles"]:
+            role_masks[row.role_id] |= permission_bits.get(row.permission_id, 0)
+        role_names = {row.id: row.name for row in self.rows["roles"]}
+
+        masks = collections.defaultdict(int)
+        user_roles = collections.defaultdict(set)
+        for row in self.rows["roles_users"]:
+            masks[row.user_id] |= role_masks.get(row.role_id, 0)
+            if row.role_id in role_names:
+                user_roles[row.user_id].add(role_names[row.role_id])
+        for row in self.rows["permissions_users"]:
+            masks[row.user_id] |= permission_bits.get(row.permission_id, 0)
+
+        # swap in complete structures so concurrent checks never see a partial compile
+        self.bits = bits
+        self.masks = dict(masks)
+        self.user_roles = {user_id: frozenset(names) for user_id, names in user_roles.items()}
+        self.superusers = frozenset(user_id for user_id, names in self.user_roles.items()
+                                    if names & self.superuser_roles)
@@ -0,0 +1,203 @@
+###############################################################################
+# Copyright (C) 2026, created on October 18, 2026
+# Written by Justin Ho
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This source code is distributed in the hope that it will be useful and
+# without warranty or implied warranty of merchantability or fitness for a
+# particular purpose.
+###############################################################################
+
+import collections
+import threading
+import time
+import zlib
+
+from sqlalchemy.sql import select
+
+from .schema import Post
+
+# columns returned with the html of a post
+post_columns = (Post.id, Post.uuid, Post.title, Post.slug, Post.type, Post.status, Post.visibility,
+                Post.featured, Post.feature_image, Post.custom_excerpt, Post.published_at, Post.updated_at)
+
+# rough per entry cost of the dictionaries and keys on top of the strings
+entry_overhead = 400
+
+
+class PostCache:
+    """Read-through cache of posts by (slug, type)
+
+    Entries are evicted least recently used first once their total size
+    exceeds max_bytes. Html bodies larger than compress_over bytes are kept
+    zlib compressed and decompressed on each hit. Missing posts are cached too.
+
+    Every ``staleness`` seconds, the first lookup polls posts for rows whose
+    updated_at moved past the newest one seen and evicts them by id, so edits,
+    including changes of slug or type, show up within that window while lookups
+    in between never query the database. updated_at has second precision, so
+    posts updated in the same second as the newest one seen are evicted again
+    by the next poll, and a post read while a poll runs is not cached.
+    Deleting a post does not move updated_at, call invalidate when deleting.
+
+    Parameters
+    ----------
+    session_factory : callable
+        returns a new database session, for example a sessionmaker
+    max_bytes : int, optional
+        size budget of the cached posts, by default 64MB
+    compress_over : int, optional
+        html bodies above this size in bytes are compressed, None disables
+        compression, by default 16KB
+    staleness : float, optional
+        seconds between polls for edited posts, by default 5
+    """
+
+    def __init__(self, session_factory, max_bytes=64 * 1024 * 1024, compress_over=16 * 1024, staleness=5.0):
+        self.session_factory = session_factory
+        self.max_bytes = max_bytes
+        self.compress_over = compress_over
+        self.staleness = staleness
+        self.entries = collections.OrderedDict()
+        # post id -> (slug, type) of its entry, to evict posts whose slug or type changed
+        self.keys = {}
+        self.size = 0
+        self.watermark = None
+        self.polled_at = None
+        # bumped by every poll, loads started before a poll may have read a row it evicted
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._lock = threading.Lock()
+        self._poll_lock = threading.Lock()
+
+    def get(self, slug, type="post"):
+        """Returns the post with its html as a dictionary, None when it does not exist"""
+        self._maybe_poll()
+        key = (slug, type)
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+        if entry is None:
+            entry = self._load(key)
+        post, html, compressed, _ = entry
+        if post is None:
+            return None
+        post = dict(post)
+        post["html"] = zlib.decompress(html).decode("utf-8") if compressed else html
+        return post
+
+    def invalidate(self, slug, type="post"):
+        """Evicts a post so the next lookup reads it again"""
+        with self._lock:
+            self._evict((slug, type))
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            self.keys.clear()
+            self.size = 0
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self.entries), "bytes": self.size, "max_bytes": self.max_bytes,
+                    "hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                    "invalidations": self.invalidations}
+
+    def _load(self, key):
+        with self._lock:
+            generation = self.generation
+        session = self.session_factory()
+        try:
+            query = select(Post.html, *post_columns).filter(Post.slug == key[0], Post.type == key[1])
+            row = session.execute(query).mappings().first()
+        finally:
+            session.close()
+
+        if row is None:
+            entry = (None, None, False, 0)
+        else:
+            post = dict(row)
+            html = post.pop("html")
+            compressed = False
+            size = entry_overhead + sum(len(value) for value in post.values() if isinstance(value, str))
+            if html is not None and self.compress_over is not None and len(html) > self.compress_over:
+                html = zlib.compress(html.encode("utf-8"))
+                compressed = True
+            size += len(html) if html else 0
+            entry = (post, html, compressed, size)
+        with self._lock:
+            self.misses += 1
+            if generation != self.generation:
+                return entry
+            self._evict(key)
+            if entry[0] is not None:
+                self._evict(self.keys.get(entry[0]["id"]))
+            if entry[3] <= self.max_bytes:
+                self.entries[key] = entry
+                if entry[0] is not None:
+                    self.keys[entry[0]["id"]] = key
+                self.size += entry[3]
+                while self.size > self.max_bytes:
+                    self._evict(next(iter(self.entries)))
+                    self.evictions += 1
+        return entry
+
+    def _evict(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[3]
+            if entry[0] is not None:
+                self.keys.pop(entry[0]["id"], None)
+
+    def _maybe_poll(self):
+        now = time.monotonic()
+        if self.polled_at is not None and now - self.polled_at < self.staleness:
+            return
+        if not self._poll_lock.acquire(blocking=False):
+            # another thread is polling, serve the current entries meanwhile
+            return
+        try:
+            self._poll()
+            self.polled_at = now
+        finally:
+            self._poll_lock.release()
+
+    def _poll(self):
+        query = select(Post.id, Post.slug, Post.type, Post.updated_at)
+        if self.watermark is None:
+            # the first poll only finds the newest edit
+            query = query.order_by(Post.updated_at.desc()).limit(1)
+        else:
+            # >= catches edits made in the same second as the newest one seen
+            query = query.filter(Post.updated_at >= self.watermark)
+        session = self.session_factory()
+        try:
+            rows = session.execute(query).all()
+        finally:
+            session.close()
+
+        with self._lock:
+            self.generation += 1
+            # a post cached with the updated_at of the last poll may have been edited again in that second
+            seen = self.watermark
+            for post_id, slug, type_, updated_at in rows:
+                if updated_at is None:
+                    continue
+                # the entry under the old slug or type if it changed, and a cached miss under the new one
+                for key in {self.keys.get(post_id), (slug, type_)}:
+                    entry = self.entries.get(key)
+                    if entry is None:
+                        continue
+                    if entry[0] is None or entry[0]["updated_at"] != updated_at or updated_at == seen:
+                        self._evict(key)
+                        self.invalidations += 1
+                if self.watermark is None or updated_at > self.watermark:
+                    self.watermark = updated_at
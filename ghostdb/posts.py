@@ -0,0 +1,127 @@
+###############################################################################
+# Copyright (C) 2026, created on October 18, 2026
+# Written by Justin Ho
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This source code is distributed in the hope that it will be useful and
+# without warranty or implied warranty of merchantability or fitness for a
+# particular purpose.
+###############################################################################
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import undefer_group
+from sqlalchemy.sql import select
+
+from .schema import Post, PostsAuthor, PostsTag, Tag, User
+from .utils import decode_cursor, encode_cursor  # noqa: F401
+
+# author columns returned with posts, never the password hash
+author_columns = (User.id, User.name, User.slug, User.email, User.profile_image, User.bio, User.website,
+                  User.status, User.visibility)
+
+
+class PostPage:
+    """One page of posts with their tags and authors
+
+    Attributes
+    ----------
+    posts : list
+        Post objects, newest first
+    tags : dict
+        post id to list of Tag objects in sort order
+    authors : dict
+        post id to list of author rows in sort order, see author_columns
+    cursor : tuple
+        (published_at, id) to pass as after to get the next page, None on the last page
+    """
+
+    def __init__(self, posts, tags, authors, cursor):
+        self.posts = posts
+        self.tags = tags
+        self.authors = authors
+        self.cursor = cursor
+
+    def __iter__(self):
+        return iter(self.posts)
+
+    def __len__(self):
+        return len(self.posts)
+
+
+def list_posts(session, tag=None, author=None, visibility=None, type="post", limit=15, after=None,
+               with_content=False):
+    """Lists published posts, newest first.
+
+    Pages are fetched by keyset on (published_at, id), so any page costs
+    the same as the first one. The tags and authors of a page are loaded
+    with one query each, three queries per page in total. The LONGTEXT body
+    columns stay deferred unless with_content is set.
+
+    Parameters
+    ----------
+    session : session
+        database session
+    tag : str, optional
+        only posts carrying the tag with this slug
+    author : str, optional
+        only posts written by the user with this slug
+    visibility : str or list, optional
+        only posts with this visibility, for example "public"
+    type : str, optional
+        post or page, by default "post"
+    limit : int, optional
+        posts per page, by default 15
+    after : tuple or str, optional
+        cursor of the previous page, see PostPage.cursor and encode_cursor
+    with_content : bool, optional
+        load mobiledoc, html and plaintext as well, by default False
+
+    Returns
+    -------
+    PostPage
+        posts of the page with their tags and authors
+    """
+    query = select(Post).filter(Post.status == "published", Post.type == type)
+    if with_content:
+        query = query.options(undefer_group("content"))
+    if tag is not None:
+        query = query.filter(Post.id.in_(
+            select(PostsTag.post_id).join(Tag, Tag.id == PostsTag.tag_id).filter(Tag.slug == tag)))
+    if author is not None:
+        query = query.filter(Post.id.in_(
+            select(PostsAuthor.post_id).join(User, User.id == PostsAuthor.author_id)
+            .filter(User.slug == author)))
+    if visibility is not None:
+        if isinstance(visibility, str):
+            visibility = [visibility]
+        query = query.filter(Post.visibility.in_(visibility))
+    if after is not None:
+        if isinstance(after, str):
+            after = decode_cursor(after)
+        published_at, post_id = after
+        # expanded form of (published_at, id) < cursor, which mysql can resolve with a range scan
+        query = query.filter(or_(Post.published_at < published_at,
+                                 and_(Post.published_at == published_at, Post.id < post_id)))
+    query = query.order_by(Post.published_at.desc(), Post.id.desc()).limit(limit + 1)
+
+    posts = session.execute(query).scalars().all()
+    cursor = None
+    if len(posts) > limit:
+        posts = posts[:limit]
+        cursor = (posts[-1].published_at, posts[-1].id)
+    ids = [post.id for post in posts]
+    tags = {post_id: [] for post_id in ids}
+    authors = {post_id: [] for post_id in ids}
+    if ids:
+        query = (select(PostsTag.post_id, Tag).join(Tag, Tag.id == PostsTag.tag_id)
+                 .filter(PostsTag.post_id.in_(ids)).order_by(PostsTag.post_id, PostsTag.sort_order))
+        for post_id, post_tag in session.execute(query):
+            tags[post_id].append(post_tag)
+        query = (select(PostsAuthor.post_id, *author_columns).join(User, User.id == PostsAuthor.author_id)
+                 .filter(PostsAuthor.post_id.in_(ids)).order_by(PostsAuthor.post_id, PostsAuthor.sort_order))
+        for row in session.execute(query):
+            authors[row.post_id].append(row)
+    return PostPage(posts, tags, authors, cursor)
@@ -0,0 +1,223 @@
+###############################################################################
+# Copyright (C) 2026, created on October 18, 2026
+# Written by Justin Ho
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This source code is distributed in the hope that it will be useful and
+# without warranty or implied warranty of merchantability or fitness for a
+# particular purpose.
+###############################################################################
+
+import collections
+import logging
+import threading
+import time
+
+from sqlalchemy import delete
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.sql import select
+
+from .schema import Brute
+from .utils import batched
+
+logger = logging.getLogger(__name__)
+
+
+def now_ms():
+    return int(time.time() * 1000)
+
+
+class RateLimiter:
+    """Sliding window rate limiter kept in memory and persisted to brute
+
+    Every key keeps the times of its last limit attempts, a key is blocked
+    while limit attempts fall within the last window seconds. Attempts only
+    change memory, flush() writes the changed keys to the brute table with
+    one INSERT ... ON DUPLICATE KEY UPDATE per 500 keys and deletes the keys
+    that were reset, so an attack costs no writes per attempt. Call start()
+    to flush every flush_interval seconds from a background thread and
+    close() to write the last changes on shutdown; attempts since the last
+    flush are lost when the process dies.
+
+    hydrate() loads the unexpired rows on startup. The table only stores the
+    first and last attempt and a count, the attempts are spread evenly
+    between the two.
+
+    Parameters
+    ----------
+    session_factory : callable
+        returns a new database session, for example a sessionmaker
+    limit : int, optional
+        attempts allowed within the window, by default 10
+    window : float, optional
+        length of the window in seconds, by default 3600
+    flush_interval : float, optional
+        seconds between writes by the background thread, by default 5
+    max_keys : int, optional
+        keys kept in memory, least recently used first out, by default 100000
+    """
+
+    def __init__(self, session_factory, limit=10, window=3600.0, flush_interval=5.0, max_keys=100000):
+        self.session_factory = session_factory
+        self.limit = limit
+        self.window = int(window * 1000)
+        self.flush_interval = flush_interval
+        self.max_keys = max_keys
+        self.attempts = collections.OrderedDict()
+        self.dirty = set()
+        self.removed = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _recent(self, key, now):
+        """Returns the attempts of key within the window, with the lock held"""
+        attempts = self.attempts.get(key)
+        if attempts is None:
+            return None
+        while attempts and attempts[0] <= now - self.window:
+            attempts.popleft()
+        self.attempts.move_to_end(key)
+        return attempts
+
+    def allowed(self, key):
+        """Returns True if key may make another attempt"""
+        with self._lock:
+            attempts = self._recent(key, now_ms())
+            return attempts is None or len(attempts) < self.limit
+
+    def retry_after(self, key):
+        """Returns the seconds until key may make another attempt, 0 if it may now"""
+        now = now_ms()
+        with self._lock:
+            attempts = self._recent(key, now)
+            if attempts is None or len(attempts) < self.limit:
+                return 0.0
+            return (attempts[0] + self.window - now) / 1000
+
+    def hit(self, key):
+        """Records a failed attempt of key
+
+        Returns
+        -------
+        bool
+            True if key is still within its limit after this attempt
+        """
+        now = now_ms()
+        with self._lock:
+            attempts = self._recent(key, now)
+            if attempts is None:
+                attempts = self.attempts[key] = collections.deque(maxlen=self.limit)
+                while len(self.attempts) > self.max_keys:
+                    evicted, _ = self.attempts.popitem(last=False)
+                    self.dirty.discard(evicted)
+            attempts.append(now)
+            self.dirty.add(key)
+            self.removed.discard(key)
+            return len(attempts) < self.limit
+
+    def reset(self, key):
+        """Forgets the attempts of key, for example after a successful login"""
+        with self._lock:
+            if self.attempts.pop(key, None) is not None:
+                self.dirty.discard(key)
+                self.removed.add(key)
+
+    def hydrate(self):
+        """Loads the unexpired counters from the brute table
+
+        Returns
+        -------
+        int
+            number of keys loaded
+        """
+        now = now_ms()
+        query = select(Brute.key, Brute.firstRequest, Brute.lastRequest, Brute.count).filter(
+            Brute.lastRequest > now - self.window)
+        session = self.session_factory()
+        try:
+            rows = session.execute(query).all()
+        finally:
+            session.close()
+        with self._lock:
+            for key, first, last, count in rows:
+                if key in self.attempts:
+                    continue
+                count = max(1, min(count, self.limit))
+                step = (last - first) / (count - 1) if count > 1 else 0
+                self.attempts[key] = collections.deque(
+                    (int(first + step * i) for i in range(count)), maxlen=self.limit)
+        return len(rows)
+
+    def flush(self):
+        """Writes changed counters to the brute table and deletes reset ones
+
+        Returns
+        -------
+        int
+            number of keys written or deleted
+        """
+        with self._lock:
+            rows = [{
+                "key": key,
+                "firstRequest": attempts[0],
+                "lastRequest": attempts[-1],
+                "lifetime": attempts[-1] + self.window,
+                "count": len(attempts),
+            } for key, attempts in ((key, self.attempts.get(key)) for key in self.dirty) if attempts]
+            removed = list(self.removed)
+            self.dirty, self.removed = set(), set()
+        if not rows and not removed:
+            return 0
+
+        brute = Brute.__table__
+        session = self.session_factory()
+        try:
+            for chunk in batched(rows, 500):
+                stmt = insert(brute)
+                stmt = stmt.on_duplicate_key_update(
+                    firstRequest=stmt.inserted.firstRequest,
+                    lastRequest=stmt.inserted.lastRequest,
+                    lifetime=stmt.inserted.lifetime,
+                    count=stmt.inserted.count,
+                )
+                session.execute(stmt, chunk)
+            for chunk in batched(removed, 500):
+                session.execute(delete(brute).where(brute.c.key.in_(chunk)))
+            session.commit()
+        except Exception:
+            session.rollback()
+            with self._lock:
+                self.dirty.update(row["key"] for row in rows if row["key"] in self.attempts)
+                self.removed.update(key for key in removed if key not in self.attempts)
+            raise
+        finally:
+            session.close()
+        return len(rows) + len(removed)
+
+    def start(self):
+        """Starts flushing from a background thread"""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="ghostdb-ratelimit", daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self):
+        """Stops the background thread and writes the remaining changes"""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                # the changes are kept and retried on the next interval
+                logger.exception("flushing brute counters failed")
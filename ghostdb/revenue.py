@@ -0,0 +1,284 @@
+###############################################################################
+# Copyright (C) 2026, created on October 18, 2026
+# Written by Justin Ho
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This source code is distributed in the hope that it will be useful and
+# without warranty or implied warranty of merchantability or fitness for a
+# particular purpose.
+###############################################################################
+
+import array
+import bisect
+import calendar
+import collections
+import datetime
+import itertools
+
+from sqlalchemy.sql import select
+
+from .schema import MembersStripeCustomersSubscription as Subscription
+
+# plan interval -> factor turning the plan amount into a monthly amount
+intervals = {"month": 1.0, "year": 1 / 12, "week": 52 / 12, "day": 365 / 12}
+
+# statuses of a subscription that is still paid for, as counted by ghost for paid members
+active_statuses = ("active", "trialing", "past_due", "unpaid")
+
+
+def timestamp(value):
+    return calendar.timegm(value.timetuple())
+
+
+def month_starts(start, end):
+    """Returns the first day of every month from the month of start to end"""
+    month = datetime.datetime(start.year, start.month, 1)
+    months = []
+    while month <= end:
+        months.append(month)
+        month = datetime.datetime(month.year + month.month // 12, month.month % 12 + 1, 1)
+    return months
+
+
+class RevenueMetrics:
+    """MRR, churn and subscriber breakdowns of the stripe subscriptions
+
+    load() reads the plan and status columns of every subscription with one
+    streamed query into typed arrays, about 40 bytes per subscription, with
+    currencies, intervals and statuses stored as small integer codes. The
+    metrics are computed over these arrays with builtins (sum, compress,
+    accumulate, bisect) rather than per object. numpy is not a dependency of
+    this library, the arrays can be handed to numpy.frombuffer when it is.
+
+    Amounts are in the smallest unit of their currency, cents for usd, as
+    stripe stores them. MRR is the plan amount normalised to a month, see
+    intervals. Results are per currency unless rates is given, a dictionary
+    currency -> factor converting into one reporting currency.
+
+    Past MRR can only be estimated from the current rows: a subscription
+    counts from its start_date and, once no longer active, until its
+    current_period_end. Plan changes are not in the table, a subscription
+    counts with its current plan over its whole life.
+
+    Parameters
+    ----------
+    statuses : iterable, optional
+        statuses counted as active, by default active_statuses
+    """
+
+    def __init__(self, statuses=active_statuses):
+        self.statuses = tuple(statuses)
+        self.currencies = []
+        self.intervals = []
+        self.status_names = []
+        self.amount = array.array("q")
+        self.mrr = array.array("d")
+        self.currency = array.array("H")
+        self.interval = array.array("B")
+        self.status = array.array("B")
+        self.start = array.array("q")
+        self.end = array.array("q")
+        self.cancelling = array.array("b")
+        self._series = None
+
+    def __len__(self):
+        return len(self.amount)
+
+    @classmethod
+    def from_session(cls, session, batch_size=10000, **kwargs):
+        metrics = cls(**kwargs)
+        metrics.load(session, batch_size)
+        return metrics
+
+    def load(self, session, batch_size=10000):
+        """Reads every subscription
+
+        Parameters
+        ----------
+        session : session
+            database session
+        batch_size : int, optional
+            rows fetched at a time from the server side cursor, by default 10000
+
+        Returns
+        -------
+        int
+            number of subscriptions read
+        """
+        self.__init__(self.statuses)
+        codes = {"currency": {}, "interval": {}, "status": {}}
+        names = {"currency": self.currencies, "interval": self.intervals, "status": self.status_names}
+
+        def code(kind, value):
+            found = codes[kind].get(value)
+            if found is None:
+                found = codes[kind][value] = len(names[kind])
+                names[kind].append(value)
+            return found
+
+        query = select(Subscription.plan_amount, Subscription.plan_interval, Subscription.plan_currency,
+                       Subscription.status, Subscription.start_date, Subscription.current_period_end,
+                       Subscription.cancel_at_period_end)
+        result = session.execute(query.execution_options(stream_results=True))
+        for rows in result.partitions(batch_size):
+            for amount, interval, currency, status, start, end, cancelling in rows:
+                interval = interval.lower()
+                if interval not in intervals:
+                    raise ValueError("unknown plan interval %r" % interval)
+                self.amount.append(amount)
+                self.mrr.append(amount * intervals[interval])
+                self.currency.append(code("currency", currency.lower()))
+                self.interval.append(code("interval", interval))
+                self.status.append(code("status", status))
+                self.start.append(timestamp(start))
+                self.end.append(timestamp(end))
+                self.cancelling.append(1 if cancelling else 0)
+        return len(self)
+
+    def active(self, include_cancelling=True):
+        """Returns one 0 or 1 per subscription, 1 for currently active ones"""
+        codes = [i for i, name in enumerate(self.status_names) if name in self.statuses]
+        flags = bytes(1 if i in codes else 0 for i in range(256))
+        mask = self.status.tobytes().translate(flags)
+        if not include_cancelling:
+            mask = bytes(a & (1 - c) for a, c in zip(mask, self.cancelling))
+        return mask
+
+    def _by_currency(self, values, mask, rates):
+        totals = collections.Counter()
+        for currency, value in zip(itertools.compress(self.currency, mask), itertools.compress(values, mask)):
+            totals[currency] += value
+        return self._convert(self._named(totals), rates)
+
+    def _named(self, totals):
+        """Returns totals keyed by currency name instead of currency code"""
+        return {self.currencies[code]: total for code, total in totals.items()}
+
+    def _convert(self, totals, rates):
+        if rates is None:
+            return totals
+        return sum(total * rates[currency] for currency, total in totals.items())
+
+    def current_mrr(self, rates=None, include_cancelling=True):
+        """Returns the MRR of the active subscriptions
+
+        Parameters
+        ----------
+        rates : dict, optional
+            currency -> conversion factor, returns a single total when given
+        include_cancelling : bool, optional
+            count subscriptions set to cancel at the end of their period, by default True
+
+        Returns
+        -------
+        dict or float
+            currency -> MRR, or the converted total
+        """
+        return self._by_currency(self.mrr, self.active(include_cancelling), rates)
+
+    def breakdown(self):
+        """Returns the number of active subscriptions and their MRR per (currency, interval)"""
+        result = {}
+        mask = self.active()
+        rows = zip(itertools.compress(self.currency, mask), itertools.compress(self.interval, mask),
+                   itertools.compress(self.mrr, mask))
+        for currency, interval, mrr in rows:
+            key = (self.currencies[currency], self.intervals[interval])
+            count, total = result.get(key, (0, 0.0))
+            result[key] = (count + 1, total + mrr)
+        return {key: {"subscriptions": count, "mrr": total} for key, (count, total) in result.items()}
+
+    def status_counts(self):
+        """Returns the number of subscriptions per status"""
+        return {self.status_names[code]: count for code, count in collections.Counter(self.status).items()}
+
+    def _prepare_series(self):
+        """Sorts the starts and ends per currency with their running MRR sums, once"""
+        if self._series is None:
+            ended = self.active()
+            series = {}
+            for code, name in enumerate(self.currencies):
+                mask = [c == code for c in self.currency]
+                starts = sorted(zip(itertools.compress(self.start, mask), itertools.compress(self.mrr, mask)))
+                stopped = [not active for active in itertools.compress(ended, mask)]
+                ends = sorted(zip(itertools.compress(itertools.compress(self.end, mask), stopped),
+                                  itertools.compress(itertools.compress(self.mrr, mask), stopped)))
+                series[name] = (
+                    array.array("q", (time for time, _ in starts)),
+                    array.array("d", itertools.accumulate((mrr for _, mrr in starts), initial=0.0)),
+                    array.array("q", (time for time, _ in ends)),
+                    array.array("d", itertools.accumulate((mrr for _, mrr in ends), initial=0.0)),
+                    array.array("q", itertools.accumulate((1 for _ in starts), initial=0)),
+                    array.array("q", itertools.accumulate((1 for _ in ends), initial=0)),
+                )
+            self._series = series
+        return self._series
+
+    def _at(self, name, moment):
+        """Returns (MRR, subscriptions) of a currency at a moment, from the prepared series"""
+        starts, start_sums, ends, end_sums, start_counts, end_counts = self._prepare_series()[name]
+        started = bisect.bisect_right(starts, moment)
+        stopped = bisect.bisect_right(ends, moment)
+        return start_sums[started] - end_sums[stopped], start_counts[started] - end_counts[stopped]
+
+    def mrr_at(self, moment, rates=None):
+        """Returns the estimated MRR at a moment (utc), see the class notes"""
+        moment = timestamp(moment)
+        return self._convert({name: self._at(name, moment)[0] for name in self.currencies}, rates)
+
+    def series(self, start, end, rates=None, points=None):
+        """Returns the estimated MRR over time
+
+        Parameters
+        ----------
+        start : datetime
+            first month (utc)
+        end : datetime
+            last moment (utc)
+        rates : dict, optional
+            currency -> conversion factor, totals are converted when given
+        points : list, optional
+            datetimes to report instead of the first day of every month
+
+        Returns
+        -------
+        list
+            (datetime, MRR per currency or converted total) tuples
+        """
+        points = points if points is not None else month_starts(start, end)
+        return [(point, self.mrr_at(point, rates)) for point in points]
+
+    def churn(self, start, end, rates=None):
+        """Returns subscriber and MRR churn between start and end (utc)
+
+        Churn is the subscriptions active at start that ended by end over the
+        subscriptions active at start, with the same estimate as mrr_at.
+
+        Returns
+        -------
+        dict
+            active, churned and rate of subscriptions, and MRR at start and churned MRR,
+            per currency or converted when rates is given
+        """
+        start, end = timestamp(start), timestamp(end)
+        active, churned = 0, 0
+        mrr_start, mrr_churned = collections.Counter(), collections.Counter()
+        rows = zip(self.currency, self.start, self.end, self.mrr, self.active())
+        for currency, begin, stop, mrr, running in rows:
+            if begin > start or (not running and stop <= start):
+                continue
+            active += 1
+            mrr_start[currency] += mrr
+            if not running and stop <= end:
+                churned += 1
+                mrr_churned[currency] += mrr
+        return {
+            "active": active,
+            "churned": churned,
+            "rate": churned / active if active else 0.0,
+            "mrr": self._convert(self._named(mrr_start), rates),
+            "mrr_churned": self._convert(self._named(mrr_churned), rates),
+        }
@@ -0,0 +1,166 @@
+###############################################################################
+# Copyright (C) 2026, created on October 18, 2026
+# Written by Justin Ho
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This source code is distributed in the hope that it will be useful and
+# without warranty or implied warranty of merchantability or fitness for a
+# particular purpose.
+###############################################################################
+
+import itertools
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql import Delete, Insert, Select, Update
+
+from .session import engine_key, get_engine
+
+routing_sessions = {}
+_lock = threading.Lock()
+
+
+class ReplicaSet:
+    """Pool of replica engines shared by the routing sessions of one database
+
+    The read your writes window is kept here rather than on the sessions so
+    that it outlives the session that wrote: a request that commits a write
+    and the next request, with a new session, both read from the primary
+    until the window ends. The window is per process.
+
+    Parameters
+    ----------
+    engines : list
+        replica engines
+    strategy : str, optional
+        "round_robin" to cycle through the replicas or "least_busy" to pick
+        the replica with the fewest checked out connections
+    """
+
+    strategies = ("round_robin", "least_busy")
+
+    def __init__(self, engines, strategy="round_robin"):
+        if strategy not in self.strategies:
+            raise ValueError("unknown strategy %r, expected one of %s"
+                             % (strategy, ", ".join(self.strategies)))
+        self.engines = list(engines)
+        self.strategy = strategy
+        self.sticky_until = 0.0
+        self._counter = itertools.count()
+
+    def stick(self, seconds):
+        """Sends reads to the primary for at least the next ``seconds``"""
+        self.sticky_until = max(self.sticky_until, time.monotonic() + seconds)
+
+    def sticky(self):
+        return time.monotonic() < self.sticky_until
+
+    def pick(self):
+        """Returns the replica engine to send the next read to"""
+        if len(self.engines) == 1:
+            return self.engines[0]
+        if self.strategy == "least_busy":
+            return min(self.engines, key=lambda engine: engine.pool.checkedout())
+        return self.engines[next(self._counter) % len(self.engines)]
+
+
+class RoutingSession(Session):
+    """Session sending reads to replicas and everything else to the primary
+
+    Flushes, INSERT/UPDATE/DELETE statements, SELECT ... FOR UPDATE, raw
+    text statements and session.connection() go to the primary. After any of
+    those every session of the same ReplicaSet keeps reading from the primary
+    for ``sticky_seconds`` so the writes are seen, see ReplicaSet. The
+    replica is picked once per transaction, so the reads of a transaction see
+    one replica and hold one connection.
+
+    Parameters
+    ----------
+    primary : sqlalchemy.engine.Engine
+        engine of the primary database
+    replicas : ReplicaSet
+        replicas to read from, reads go to the primary when empty
+    sticky_seconds : float, optional
+        how long reads stay on the primary after a write, by default 5
+    """
+
+    def __init__(self, primary, replicas, sticky_seconds=5.0, **kw):
+        super().__init__(**kw)
+        self.primary = primary
+        self.replicas = replicas
+        self.sticky_seconds = sticky_seconds
+        self._replica = None
+        event.listen(self, "after_transaction_end", self._release_replica)
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._flushing or not self._is_read(clause):
+            self.replicas.stick(self.sticky_seconds)
+            return self.primary
+        if not self.replicas.engines or self.replicas.sticky():
+            return self.primary
+        if self._replica is None:
+            self._replica = self.replicas.pick()
+        return self._replica
+
+    def _release_replica(self, session, transaction):
+        if transaction.parent is None:
+            self._replica = None
+
+    def use_primary(self, seconds=None):
+        """Sends reads to the primary for the next ``seconds``, sticky_seconds by default"""
+        self.replicas.stick(self.sticky_seconds if seconds is None else seconds)
+
+    @staticmethod
+    def _is_read(clause):
+        if isinstance(clause, (Insert, Update, Delete)):
+            return False
+        if isinstance(clause, Select):
+            return clause._for_update_arg is None
+        # text statements, session.connection() and anything else we can't inspect
+        return False
+
+
+def get_routing_session(primary, replicas, strategy="round_robin", sticky_seconds=5.0, **engine_options):
+    """Gets a session reading from replicas and writing to the primary.
+
+    Parameters
+    ----------
+    primary : dict
+        keyword arguments of get_engine for the primary, username, password,
+        host, dbname and optionally port
+    replicas : list
+        list of keyword arguments of get_engine, one per replica
+    strategy : str, optional
+        "round_robin" or "least_busy", by default "round_robin"
+    sticky_seconds : float, optional
+        how long reads stay on the primary after a write, by default 5
+    **engine_options
+        echo, pool_pre_ping, instrumentation and pool options applied to all engines
+
+    Returns
+    -------
+    session : RoutingSession
+        return session to the database
+    """
+    primary_engine = get_engine(**primary, **engine_options)
+    replica_engines = [get_engine(**replica, **engine_options) for replica in replicas]
+
+    key_options = {name: value for name, value in engine_options.items() if name != "instrumentation"}
+
+    def key_of(info):
+        return engine_key(info["username"], info["host"], info.get("port", 3306), info["dbname"],
+                          **key_options)
+
+    key = (key_of(primary), tuple(key_of(replica) for replica in replicas), strategy, sticky_seconds)
+    if key not in routing_sessions:
+        with _lock:
+            if key not in routing_sessions:
+                routing_sessions[key] = sessionmaker(class_=RoutingSession, primary=primary_engine,
+                                                     replicas=ReplicaSet(replica_engines, strategy),
+                                                     sticky_seconds=sticky_seconds)
+    return routing_sessions[key]()
@@ -0,0 +1,293 @@
+###############################################################################
+# Copyright (C) 2026, created on October 18, 2026
+# Written by Justin Ho
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This source code is distributed in the hope that it will be useful and
+# without warranty or implied warranty of merchantability or fitness for a
+# particular purpose.
+###############################################################################
+
+import collections
+import heapq
+import math
+import os
+import pickle
+import re
+import threading
+import zlib
+from array import array
+
+from sqlalchemy import and_, or_
+from sqlalchemy.sql import select
+
+from .schema import Post, PostsTag, Tag
+
+token_re = re.compile(r"\w+", re.UNICODE)
+stopwords = frozenset("""
+a an and are as at be but by for from has have in is it its of on or that the this to was were will with
+""".split())
+
+# weight of a term occurrence per field
+field_weights = (("title", 3), ("custom_excerpt", 2), ("plaintext", 1))
+
+
+def tokenize(text):
+    """Splits text in lower case terms, dropping stopwords and single characters"""
+    if not text:
+        return []
+    return [term for term in token_re.findall(text.lower()) if len(term) > 1 and term not in stopwords]
+
+
+class SearchIndex:
+    """Inverted index over the title, custom_excerpt and plaintext of posts
+
+    Postings are kept per term in compact arrays of (document, weighted term
+    frequency) pairs and results are ranked with BM25. Updating a post appends
+    a new document and marks the old one deleted, deleted documents are
+    dropped from the postings once they make up a quarter of the index.
+
+    The index is kept up to date with update(), which only reads posts whose
+    updated_at moved since the last run. updated_at has second precision, so
+    the posts updated in the second of the last run are indexed again in case
+    they were edited after it. The index is stored with save() as a compressed
+    file loaded back with SearchIndex.load().
+
+    Parameters
+    ----------
+    k1 : float, optional
+        BM25 term frequency saturation, by default 1.2
+    b : float, optional
+        BM25 length normalisation, by default 0.75
+    """
+
+    def __init__(self, k1=1.2, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings = {}
+        self.doc_ids = []
+        self.doc_lengths = array("I")
+        self.doc_meta = []
+        self.live = {}
+        self.total_length = 0
+        self.watermark = None
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.live)
+
+    def add(self, post_id, title=None, custom_excerpt=None, plaintext=None, status=None, visibility=None,
+            tags=(), updated_at=None):
+        """Indexes a post, replacing the previous version of it"""
+        fields = {"title": title, "custom_excerpt": custom_excerpt, "plaintext": plaintext}
+        frequencies = collections.Counter()
+        length = 0
+        for field, weight in field_weights:
+            terms = tokenize(fields[field])
+            length += len(terms)
+            for term in terms:
+                frequencies[term] += weight
+        with self._lock:
+            self.remove(post_id)
+            doc = len(self.doc_ids)
+            self.doc_ids.append(post_id)
+            self.doc_lengths.append(length)
+            self.doc_meta.append((status, visibility, frozenset(tags), updated_at))
+            self.live[post_id] = doc
+            self.total_length += length
+            for term, frequency in frequencies.items():
+                postings = self.postings.get(term)
+                if postings is None:
+                    postings = self.postings[term] = array("I")
+                postings.extend((doc, frequency))
+
+    def remove(self, post_id):
+        """Marks a post deleted"""
+        with self._lock:
+            doc = self.live.pop(post_id, None)
+            if doc is None:
+                return
+            self.total_length -= self.doc_lengths[doc]
+            self.doc_ids[doc] = None
+            if len(self.doc_ids) > 1000 and len(self.live) < 0.75 * len(self.doc_ids):
+                self.compact()
+
+    def compact(self):
+        """Renumbers the live documents and drops deleted ones from the postings"""
+        with self._lock:
+            mapping = {}
+            doc_ids, doc_lengths, doc_meta = [], array("I"), []
+            for doc, post_id in enumerate(self.doc_ids):
+                if post_id is not None:
+                    mapping[doc] = len(doc_ids)
+                    doc_ids.append(post_id)
+                    doc_lengths.append(self.doc_lengths[doc])
+                    doc_meta.append(self.doc_meta[doc])
+            postings = {}
+            for term, old in self.postings.items():
+                new = array("I")
+                for i in range(0, len(old), 2):
+                    doc = mapping.get(old[i])
+                    if doc is not None:
+                        new.extend((doc, old[i + 1]))
+                if new:
+                    postings[term] = new
+            self.postings = postings
+            self.doc_ids, self.doc_lengths, self.doc_meta = doc_ids, doc_lengths, doc_meta
+            self.live = {post_id: doc for doc, post_id in enumerate(doc_ids)}
+
+    def search(self, query, limit=10, status="published", visibility=None, tag=None):
+        """Returns the best matching posts
+
+        Parameters
+        ----------
+        query : str
+            search terms, posts matching more terms rank higher
+        limit : int, optional
+            number of results, by default 10
+        status : str, optional
+            only posts with this status, None for any, by default "published"
+        visibility : str, optional
+            only posts with this visibility
+        tag : str, optional
+            only posts carrying the tag with this slug
+
+        Returns
+        -------
+        list
+            (post id, score) tuples, best first
+        """
+        with self._lock:
+            count = len(self.live)
+            if not count:
+                return []
+            average_length = self.total_length / count or 1.0
+            scores = collections.defaultdict(float)
+            for term in set(tokenize(query)):
+                postings = self.postings.get(term)
+                if postings is None:
+                    continue
+                # deleted documents still in the postings can make the count exceed the live documents
+                frequency = min(len(postings) // 2, count)
+                idf = math.log(1 + (count - frequency + 0.5) / (frequency + 0.5))
+                for i in range(0, len(postings), 2):
+                    doc = postings[i]
+                    if self.doc_ids[doc] is None:
+                        continue
+                    tf = postings[i + 1]
+                    norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc] / average_length)
+                    scores[doc] += idf * tf * (self.k1 + 1) / (tf + norm)
+
+            def matches(doc):
+                doc_status, doc_visibility, doc_tags, _ = self.doc_meta[doc]
+                return ((status is None or doc_status == status)
+                        and (visibility is None or doc_visibility == visibility)
+                        and (tag is None or tag in doc_tags))
+
+            candidates = (item for item in scores.items() if matches(item[0]))
+            best = heapq.nlargest(limit, candidates, key=lambda item: item[1])
+            return [(self.doc_ids[doc], score) for doc, score in best]
+
+    def update(self, session, batch_size=500):
+        """Indexes the posts edited since the last update and drops deleted posts
+
+        Parameters
+        ----------
+        session : session
+            database session
+        batch_size : int, optional
+            posts read per query, by default 500
+
+        Returns
+        -------
+        tuple
+            number of posts indexed and removed
+        """
+        columns = (Post.id, Post.title, Post.custom_excerpt, Post.plaintext, Post.status, Post.visibility,
+                   Post.updated_at)
+        indexed = 0
+        cursor = None
+        seen = self.watermark
+        while True:
+            query = select(*columns)
+            if cursor is not None:
+                query = query.filter(self._after(cursor))
+            elif self.watermark is not None:
+                # >= catches edits made in the same second as the last update
+                query = query.filter(Post.updated_at >= self.watermark)
+            rows = session.execute(query.order_by(Post.updated_at, Post.id).limit(batch_size)).all()
+            if not rows:
+                break
+            cursor = (rows[-1].updated_at, rows[-1].id)
+            rows = [row for row in rows if self._changed(row.id, row.updated_at, seen)]
+            if not rows:
+                continue
+            tags = collections.defaultdict(set)
+            query = (select(PostsTag.post_id, Tag.slug).join(Tag, Tag.id == PostsTag.tag_id)
+                     .filter(PostsTag.post_id.in_([row.id for row in rows])))
+            for post_id, slug in session.execute(query):
+                tags[post_id].add(slug)
+            for row in rows:
+                self.add(row.id, row.title, row.custom_excerpt, row.plaintext, row.status, row.visibility,
+                         tags[row.id], row.updated_at)
+            indexed += len(rows)
+        if cursor is not None and cursor[0] is not None:
+            self.watermark = cursor[0]
+
+        existing = set(session.execute(select(Post.id)).scalars())
+        removed = [post_id for post_id in list(self.live) if post_id not in existing]
+        for post_id in removed:
+            self.remove(post_id)
+        return indexed, len(removed)
+
+    @staticmethod
+    def _after(cursor):
+        updated_at, post_id = cursor
+        if updated_at is None:
+            # mysql sorts null first
+            return or_(Post.updated_at.isnot(None), and_(Post.updated_at.is_(None), Post.id > post_id))
+        return or_(Post.updated_at > updated_at, and_(Post.updated_at == updated_at, Post.id > post_id))
+
+    def _changed(self, post_id, updated_at, seen):
+        doc = self.live.get(post_id)
+        # an edit in the same second as the indexed version keeps updated_at, only seen tells it apart
+        return doc is None or updated_at is None or updated_at == seen or self.doc_meta[doc][3] != updated_at
+
+    def save(self, path):
+        """Writes the index to path, replacing it atomically"""
+        with self._lock:
+            if len(self.live) < len(self.doc_ids):
+                self.compact()
+            state = {
+                "k1": self.k1,
+                "b": self.b,
+                "watermark": self.watermark,
+                "doc_ids": self.doc_ids,
+                "doc_lengths": self.doc_lengths.tobytes(),
+                "doc_meta": self.doc_meta,
+                "postings": {term: postings.tobytes() for term, postings in self.postings.items()},
+            }
+            data = zlib.compress(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+        with open(path + ".tmp", "wb") as f:
+            f.write(data)
+        os.replace(path + ".tmp", path)
+
+    @classmethod
+    def load(cls, path):
+        """Reads an index written by save"""
+        with open(path, "rb") as f:
+            state = pickle.loads(zlib.decompress(f.read()))
+        index = cls(state["k1"], state["b"])
+        index.watermark = state["watermark"]
+        index.doc_ids = state["doc_ids"]
+        index.doc_lengths.frombytes(state["doc_lengths"])
+        index.doc_meta = state["doc_meta"]
+        for term, data in state["postings"].items():
+            postings = index.postings[term] = array("I")
+            postings.frombytes(data)
+        index.live = {post_id: doc for doc, post_id in enumerate(index.doc_ids)}
+        index.total_length = sum(index.doc_lengths)
+        return index
@@ -11,16 +11,248 @@
 # particular purpose.
 ###############################################################################
 
-from sqlalchemy import create_engine
+import threading
+import time
+
+from sqlalchemy import create_engine, exc
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 conn_template = "mysql://%(username)s:%(password)s@%(host)s:%(port)s/%(dbname)s"
+async_conn_template = "mysql+aiomysql://%(username)s:%(password)s@%(host)s:%(port)s/%(dbname)s"
+
+pool_defaults = {"pool_size": 5, "max_overflow": 10, "pool_recycle": -1, "pool_timeout": 30}
 
+# registries are keyed by engine_key, engines are only created while holding _lock
+engines = {}
 sessions = {}
+async_engines = {}
+async_sessions = {}
+pool_stats = {}
+async_pool_stats = {}
+_lock = threading.Lock()
+
+
+class PoolStats:
+    """Counters collected from a connection pool
+
+    Wait time is measured from the moment a connection is requested until it
+    is handed out, so it includes opening new connections and pre pings.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.timeouts = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+        self.max_checkedout = 0
+        self.max_overflow = 0
+
+    def record_checkout(self, wait, checkedout, overflow):
+        with self._lock:
+            self.checkouts += 1
+            self.wait_time += wait
+            self.max_wait = max(self.max_wait, wait)
+            self.max_checkedout = max(self.max_checkedout, checkedout)
+            self.max_overflow = max(self.max_overflow, overflow)
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def record_checkin(self):
+        with self._lock:
+            self.checkins += 1
+
+    def record_connect(self):
+        with self._lock:
+            self.connects += 1
+
+    def snapshot(self, pool=None):
+        """Returns the counters as a dictionary
+
+        Parameters
+        ----------
+        pool : sqlalchemy.pool.QueuePool, optional
+            pool to read the current size and usage from
+
+        Returns
+        -------
+        dict
+            counters, averages and, when a pool is given, its current state
+        """
+        with self._lock:
+            stats = {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "timeouts": self.timeouts,
+                "wait_time": self.wait_time,
+                "avg_wait": self.wait_time / self.checkouts if self.checkouts else 0.0,
+                "max_wait": self.max_wait,
+                "max_checkedout": self.max_checkedout,
+                "max_overflow": self.max_overflow,
+            }
+        if pool is not None:
+            stats.update({"size": pool.size(), "checkedin": pool.checkedin(),
+                          "checkedout": pool.checkedout(), "overflow": pool.overflow()})
+        return stats
+
+
+class StatsPoolMixin:
+    """Records checkout, checkin and wait statistics in ``self.stats``"""
+
+    stats = None
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            conn = super().connect()
+        except exc.TimeoutError:
+            self.stats.record_timeout()
+            raise
+        self.stats.record_checkout(time.perf_counter() - start, self.checkedout(), max(self.overflow(), 0))
+        return conn
+
+    def _do_return_conn(self, conn):
+        self.stats.record_checkin()
+        super()._do_return_conn(conn)
+
+    def _create_connection(self):
+        self.stats.record_connect()
+        return super()._create_connection()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+class StatsQueuePool(StatsPoolMixin, QueuePool):
+    pass
+
+
+class StatsAsyncAdaptedQueuePool(StatsPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
 
+def engine_key(username, host, port, dbname, **options):
+    """Builds the registry key for a database connection
 
-def get_session(username, password, host, dbname, port=3306, echo=False, pool_pre_ping=False):
+    Parameters
+    ----------
+    username : str
+        username
+    host : str
+        string to host
+    port : int
+        port of database
+    dbname : str
+        database
+    **options
+        engine options, engines with different options are kept apart
+
+    Returns
+    -------
+    tuple
+        hashable key identifying the engine
+    """
+    return (username, host, int(port), dbname, tuple(sorted(options.items())))
+
+
+def _engine_options(echo, pool_pre_ping, pool_options):
+    options = dict(pool_defaults)
+    options.update({k: v for k, v in pool_options.items() if v is not None})
+    options.update({"echo": echo, "pool_pre_ping": pool_pre_ping})
+    return options
+
+
+def get_engine(username, password, host, dbname, port=3306, echo=False, pool_pre_ping=False,
+               instrumentation=None, **pool_options):
+    """Gets the engine for a database, creating it on first use.
+
+    Parameters
+    ----------
+    username : str
+        username
+    password : str
+        password
+    host : str
+        string to host
+    dbname : str
+        database
+    port : int, optional
+        port of database, by default 3306
+    echo : bool, optional
+        echos sql commands if true, by default False
+    pool_pre_ping : bool, optional
+        set true for long lived processes, by default False
+    instrumentation : QueryInstrumentation, optional
+        records the statements executed by the engine, see ghostdb.instrumentation
+    **pool_options
+        pool_size, max_overflow, pool_recycle and pool_timeout, see pool_defaults
+
+    Returns
+    -------
+    engine : sqlalchemy.engine.Engine
+        engine shared by all callers using the same connection and options
+    """
+    options = _engine_options(echo, pool_pre_ping, pool_options)
+    key = engine_key(username, host, port, dbname, **options)
+    engine = engines.get(key)
+    if engine is None:
+        with _lock:
+            if key not in engines:
+                auth_info = {"username": username, "password": password, "host": host, "port": port,
+                             "dbname": dbname}
+                engine = create_engine(conn_template % auth_info, poolclass=StatsQueuePool, **options)
+                engine.pool.stats = pool_stats[key] = PoolStats()
+                sessions[key] = sessionmaker(bind=engine)
+                engines[key] = engine
+            engine = engines[key]
+    # attached on every call, the engine may have been created without instrumentation
+    if instrumentation is not None:
+        instrumentation.attach(engine)
+    return engine
+
+
+def get_async_engine(username, password, host, dbname, port=3306, echo=False, pool_pre_ping=False,
+                     instrumentation=None, **pool_options):
+    """Gets the asyncio engine for a database, creating it on first use.
+
+    Parameters are the same as get_engine.
+
+    Returns
+    -------
+    engine : sqlalchemy.ext.asyncio.AsyncEngine
+        engine shared by all callers using the same connection and options
+    """
+    options = _engine_options(echo, pool_pre_ping, pool_options)
+    key = engine_key(username, host, port, dbname, **options)
+    engine = async_engines.get(key)
+    if engine is None:
+        with _lock:
+            if key not in async_engines:
+                auth_info = {"username": username, "password": password, "host": host, "port": port,
+                             "dbname": dbname}
+                engine = create_async_engine(async_conn_template % auth_info,
+                                             poolclass=StatsAsyncAdaptedQueuePool, **options)
+                engine.sync_engine.pool.stats = async_pool_stats[key] = PoolStats()
+                # attributes are not reloaded after commit, lazy loads cannot run implicitly under asyncio
+                async_sessions[key] = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+                async_engines[key] = engine
+            engine = async_engines[key]
+    if instrumentation is not None:
+        instrumentation.attach(engine.sync_engine)
+    return engine
+
+
+def get_session(username, password, host, dbname, port=3306, echo=False, pool_pre_ping=False,
+                instrumentation=None, **pool_options):
     """Gets a session to the database.
 
     Parameters
@@ -39,16 +271,84 @@ def get_session(username, password, host, dbname, port=3306, echo=False, pool_pr
         echos sql commands if true, by default False
     pool_pre_ping : bool, optional
         set true for long lived processes, by default False
+    instrumentation : QueryInstrumentation, optional
+        records the statements executed by the engine, see ghostdb.instrumentation
+    **pool_options
+        pool_size, max_overflow, pool_recycle and pool_timeout, see pool_defaults
 
     Returns
     -------
     session : sqlalchemy.orm.session.Session
         return session to database
     """
-    auth_info = {"username": username, "password": password, "host": host, "port": port, "dbname": dbname}
-    if username in sessions:
-        return sessions[username]()
+    options = _engine_options(echo, pool_pre_ping, pool_options)
+    key = engine_key(username, host, port, dbname, **options)
+    if key not in sessions or instrumentation is not None:
+        get_engine(username, password, host, dbname, port, echo, pool_pre_ping, instrumentation,
+                   **pool_options)
+    return sessions[key]()
+
+
+def get_async_session(username, password, host, dbname, port=3306, echo=False, pool_pre_ping=False,
+                      instrumentation=None, **pool_options):
+    """Gets an asyncio session to the database.
+
+    The session is backed by the aiomysql driver and an engine kept separately
+    from the ones used by get_session, so the same credentials can be used from
+    both blocking and asyncio code.
+
+    Parameters
+    ----------
+    username : str
+        username
+    password : str
+        password
+    host : str
+        string to host
+    dbname : str
+        database
+    port : int, optional
+        port of database, by default 3306
+    echo : bool, optional
+        echos sql commands if true, by default False
+    pool_pre_ping : bool, optional
+        set true for long lived processes, by default False
+    instrumentation : QueryInstrumentation, optional
+        records the statements executed by the engine, see ghostdb.instrumentation
+    **pool_options
+        pool_size, max_overflow, pool_recycle and pool_timeout, see pool_defaults
+
+    Returns
+    -------
+    session : sqlalchemy.ext.asyncio.AsyncSession
+        return asyncio session to database, to be used with ``async with``
+    """
+    options = _engine_options(echo, pool_pre_ping, pool_options)
+    key = engine_key(username, host, port, dbname, **options)
+    if key not in async_sessions or instrumentation is not None:
+        get_async_engine(username, password, host, dbname, port, echo, pool_pre_ping, instrumentation,
+                         **pool_options)
+    return async_sessions[key]()
+
+
+def get_pool_stats():
+    """Gets the pool statistics of every engine created so far.
 
-    engine = create_engine(conn_template % auth_info, echo=echo, pool_pre_ping=pool_pre_ping)
-    sessions[username] = sessionmaker(bind=engine)
-    return sessions[username]()
+    Returns
+    -------
+    dict
+        maps "user@host:port/dbname" to the counters of its pool, asyncio
+        engines are prefixed with "async:"
+    """
+    stats = {}
+    with _lock:
+        items = [(key, pool_stat, engines[key].pool, "") for key, pool_stat in pool_stats.items()]
+        items += [(key, pool_stat, async_engines[key].sync_engine.pool, "async:")
+                  for key, pool_stat in async_pool_stats.items()]
+    for key, pool_stat, pool, prefix in items:
+        name = "%s%s@%s:%s/%s" % (prefix, key[0], key[1], key[2], key[3])
+        if name in stats:
+            # same database opened with different options
+            name = "%s %s" % (name, dict(key[4]))
+        stats[name] = pool_stat.snapshot(pool)
+    return stats
@@ -0,0 +1,168 @@
+###############################################################################
+# Copyright (C) 2026, created on October 18, 2026
+# Written by Justin Ho
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This source code is distributed in the hope that it will be useful and
+# without warranty or implied warranty of merchantability or fitness for a
+# particular purpose.
+###############################################################################
+
+import json
+import threading
+import time
+
+from sqlalchemy.sql import select
+
+from .schema import Setting
+
+_missing = object()
+
+
+def parse_setting(value, type_):
+    """Converts a settings.value string according to settings.type
+
+    Parameters
+    ----------
+    value : str
+        stored value
+    type_ : str
+        one of boolean, number, array, object or string
+
+    Returns
+    -------
+    object
+        parsed value, the raw string when it can not be parsed
+    """
+    if value is None:
+        return None
+    try:
+        if type_ == "boolean":
+            return value.strip().lower() == "true"
+        if type_ == "number":
+            number = float(value)
+            return int(number) if number.is_integer() else number
+        if type_ in ("array", "object"):
+            return json.loads(value)
+    except ValueError:
+        pass
+    return value
+
+
+class SettingsCache:
+    """In-memory copy of the settings table
+
+    All settings are loaded with one query. Once ``ttl`` has elapsed the next
+    lookup reloads the rows updated at or after the newest updated_at seen,
+    so edits made within that same second are not missed, and reads the keys
+    of the table to find added and removed settings. Subscribers are called
+    with (key, old, new) for each change, removed keys have a new value of
+    None.
+
+    Parameters
+    ----------
+    session_factory : callable
+        returns a new database session, for example a sessionmaker
+    ttl : float, optional
+        seconds between polls for changes, by default 60
+    """
+
+    def __init__(self, session_factory, ttl=60.0):
+        self.session_factory = session_factory
+        self.ttl = ttl
+        self.values = {}
+        self.rows = {}
+        self.watermark = None
+        self.checked_at = None
+        self.subscribers = []
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Returns the parsed value of a setting"""
+        self._maybe_refresh()
+        value = self.values.get(key, _missing)
+        return default if value is _missing else value
+
+    def __getitem__(self, key):
+        self._maybe_refresh()
+        return self.values[key]
+
+    def __contains__(self, key):
+        self._maybe_refresh()
+        return key in self.values
+
+    def group(self, group):
+        """Returns the parsed values of a settings group as a dictionary"""
+        self._maybe_refresh()
+        return {key: self.values[key] for key, row in list(self.rows.items()) if row["group"] == group}
+
+    def subscribe(self, callback):
+        """Registers callback(key, old, new) for changes and returns a function removing it"""
+        self.subscribers.append(callback)
+        return lambda: self.subscribers.remove(callback)
+
+    def _maybe_refresh(self):
+        if self.checked_at is None:
+            self.refresh()
+        elif time.monotonic() - self.checked_at >= self.ttl and self._lock.acquire(blocking=False):
+            # readers keep using the current values while one thread polls
+            try:
+                self._refresh()
+            finally:
+                self._lock.release()
+
+    def refresh(self, full=False):
+        """Polls for changes now
+
+        Parameters
+        ----------
+        full : bool, optional
+            reload every setting instead of polling, by default False
+        """
+        with self._lock:
+            self._refresh(full)
+
+    def _refresh(self, full=False):
+        columns = (Setting.key, Setting.value, Setting.type, Setting.group, Setting.updated_at)
+        incremental = not full and self.checked_at is not None and self.watermark is not None
+        session = self.session_factory()
+        try:
+            query = select(*columns)
+            if incremental:
+                # >= catches edits made in the same second as the last one seen
+                query = query.filter(Setting.updated_at >= self.watermark)
+            rows = [dict(row) for row in session.execute(query).mappings()]
+            if incremental:
+                keys = set(session.execute(select(Setting.key)).scalars())
+                added = keys - set(self.rows) - {row["key"] for row in rows}
+                if added:
+                    # inserted with an updated_at older than the watermark
+                    query = select(*columns).filter(Setting.key.in_(added))
+                    rows += [dict(row) for row in session.execute(query).mappings()]
+            else:
+                keys = {row["key"] for row in rows}
+        finally:
+            session.close()
+
+        changes = []
+        for row in rows:
+            old = self.rows.get(row["key"])
+            value = parse_setting(row["value"], row["type"])
+            if old is None or old["value"] != row["value"] or old["type"] != row["type"]:
+                changes.append((row["key"], self.values.get(row["key"]), value))
+            self.rows[row["key"]] = row
+            self.values[row["key"]] = value
+        for key in set(self.rows) - keys:
+            del self.rows[key]
+            changes.append((key, self.values.pop(key), None))
+        updated = [row["updated_at"] for row in self.rows.values() if row["updated_at"] is not None]
+        self.watermark = max(updated) if updated else None
+        initial = self.checked_at is None
+        self.checked_at = time.monotonic()
+        if not initial:
+            for key, old, new in changes:
+                for callback in list(self.subscribers):
+                    callback(key, old, new)
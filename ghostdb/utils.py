@@ -0,0 +1,90 @@
+###############################################################################
+# Copyright (C) 2026, created on October 18, 2026
+# Written by Justin Ho
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This source code is distributed in the hope that it will be useful and
+# without warranty or implied warranty of merchantability or fitness for a
+# particular purpose.
+###############################################################################
+
+import datetime
+import itertools
+import os
+import re
+import threading
+import time
+
+_counter = itertools.count(int.from_bytes(os.urandom(3), "big"))
+_counter_lock = threading.Lock()
+_process_id = os.urandom(5)
+
+
+def object_id():
+    """Generates an id in the format used by ghost for primary keys
+
+    Ids are 24 hex characters laid out like a mongodb ObjectId, a 4 byte
+    timestamp, 5 random bytes and a 3 byte counter, so they sort roughly by
+    creation time.
+
+    Returns
+    -------
+    str
+        24 character hex id
+    """
+    with _counter_lock:
+        count = next(_counter) & 0xFFFFFF
+    return (int(time.time()).to_bytes(4, "big") + _process_id + count.to_bytes(3, "big")).hex()
+
+
+def slugify(name):
+    """Converts a name to a slug as used by labels and tags
+
+    Parameters
+    ----------
+    name : str
+        name to convert
+
+    Returns
+    -------
+    str
+        lower case slug with words separated by dashes
+    """
+    return re.sub(r"[^\w]+", "-", name.strip().lower()).strip("-")[:191]
+
+
+def batched(iterable, size):
+    """Splits an iterable into lists of at most size elements
+
+    Parameters
+    ----------
+    iterable : iterable
+        elements to split
+    size : int
+        maximum number of elements per list
+
+    Yields
+    ------
+    list
+        next batch of elements
+    """
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def encode_cursor(cursor):
+    """Encodes a (datetime, id) keyset cursor as a string, for use in urls and files"""
+    return "%s_%s" % (cursor[0].strftime("%Y%m%d%H%M%S%f"), cursor[1])
+
+
+def decode_cursor(value):
+    """Decodes a cursor created with encode_cursor"""
+    moment, row_id = value.split("_", 1)
+    return datetime.datetime.strptime(moment, "%Y%m%d%H%M%S%f"), row_id